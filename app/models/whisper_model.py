@@ -8,9 +8,15 @@ data structures.
 
 import json
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 from pydantic import BaseModel, HttpUrl, Field
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class WhisperModel(BaseModel):
     """
@@ -23,6 +29,14 @@ class WhisperModel(BaseModel):
     download_url: HttpUrl = Field(..., description="URL for downloading the model")
     size_mb: int = Field(..., gt=0, description="Model size in megabytes")
     sha256: str = Field(..., min_length=64, max_length=64, description="SHA256 checksum")
+    blake3: Optional[str] = Field(
+        None, min_length=64, max_length=64,
+        description="Optional BLAKE3 checksum, used for fast verification when available"
+    )
+    sha256_tree: Optional[List[str]] = Field(
+        None,
+        description="Optional SHA256 digests of consecutive 256 MiB shards, verified in parallel"
+    )
     description: str = Field(..., description="Detailed model description")
 
     class Config:
@@ -65,10 +79,14 @@ class WhisperModelConfig(BaseModel):
         if not file_path.exists():
             raise FileNotFoundError(f"Model configuration file not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Prefer orjson's faster parser when installed
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(file_path.read_bytes())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
-        return cls(**data)
+        return cls.model_validate(data)
 
     def get_model(self, model_id: str) -> Optional[WhisperModel]:
         """
@@ -7,7 +7,6 @@ from typing import Optional, List
 import logging
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -2,6 +2,8 @@
 Secure credentials management using macOS Keychain
 """
 
+import time
+
 import keyring
 
 
@@ -11,11 +13,36 @@ class CredentialsManager:
     SERVICE_NAME = "com.audiotranslocal.app"
     N8N_API_KEY_ACCOUNT = "n8n_api_key"
     
+    # Seconds a Keychain read is reused; each read is an IPC round trip to
+    # securityd. Bounds how long an edit made outside the app goes unseen.
+    API_KEY_CACHE_TTL = 300.0
+    
+    def __init__(self):
+        self._cached_api_key = None
+        self._cached_at = 0.0
+    
+    def _cache_api_key(self, api_key):
+        """Remember the API key as last read from or written to the Keychain"""
+        self._cached_api_key = api_key
+        self._cached_at = time.monotonic()
+    
+    def get_cached_n8n_api_key(self):
+        """Return the API key if it is cached and fresh, else None (never reads the Keychain)"""
+        if self._cached_api_key is not None and time.monotonic() - self._cached_at < self.API_KEY_CACHE_TTL:
+            return self._cached_api_key
+        return None
+    
     def get_n8n_api_key(self):
         """Retrieve n8n API key from Keychain"""
+        cached_api_key = self.get_cached_n8n_api_key()
+        if cached_api_key is not None:
+            return cached_api_key
+        
         try:
             api_key = keyring.get_password(self.SERVICE_NAME, self.N8N_API_KEY_ACCOUNT)
-            return api_key if api_key else ""
+            api_key = api_key if api_key else ""
+            self._cache_api_key(api_key)
+            return api_key
         except Exception as e:
             print("Error retrieving API key from Keychain: " + str(e))
             return ""
@@ -25,6 +52,7 @@ class CredentialsManager:
         try:
             if api_key.strip():
                 keyring.set_password(self.SERVICE_NAME, self.N8N_API_KEY_ACCOUNT, api_key.strip())
+                self._cache_api_key(api_key.strip())
                 return True
             else:
                 # If empty key, delete from keychain
@@ -38,9 +66,11 @@ class CredentialsManager:
         """Delete n8n API key from Keychain"""
         try:
             keyring.delete_password(self.SERVICE_NAME, self.N8N_API_KEY_ACCOUNT)
+            self._cache_api_key("")
             return True
         except keyring.errors.PasswordDeleteError:
             # Key doesn't exist, which is fine
+            self._cache_api_key("")
             return True
         except Exception as e:
             print("Error deleting API key from Keychain: " + str(e))
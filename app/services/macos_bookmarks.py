@@ -92,6 +92,27 @@ class SecurityScopedBookmarkManager:
             Tuple of (folder_path, security_scoped_url) or None if resolution failed
             The security_scoped_url should be used to start accessing the folder.
         """
+        result = SecurityScopedBookmarkManager.resolve_bookmark_with_staleness(bookmark_data)
+        if result:
+            folder_path, resolved_url, _ = result
+            return folder_path, resolved_url
+        return None
+    
+    @staticmethod
+    def resolve_bookmark_with_staleness(bookmark_data: str) -> Optional[Tuple[str, object, bool]]:
+        """
+        Resolve a security-scoped bookmark, also reporting whether it is stale.
+        
+        A stale bookmark still resolves, but should be re-created from the
+        resolved URL so later launches keep working.
+        
+        Args:
+            bookmark_data: Base64-encoded bookmark data
+            
+        Returns:
+            Tuple of (folder_path, security_scoped_url, is_stale) or None if
+            resolution failed
+        """
         if not SecurityScopedBookmarkManager.is_available():
             print("Security-scoped bookmarks not available on this platform")
             return None
@@ -121,7 +142,7 @@ class SecurityScopedBookmarkManager:
                 else:
                     print(f"✅ Resolved security-scoped bookmark to: {folder_path}")
                 
-                return folder_path, resolved_url
+                return folder_path, resolved_url, bool(is_stale)
             else:
                 print("Failed to resolve bookmark")
                 return None
@@ -196,6 +217,9 @@ class BookmarkAwareSettings:
         """
         self.settings = settings
         self._active_urls = {}  # Track active security-scoped URLs
+        # Folder paths resolved from bookmarks this session, keyed like
+        # _active_urls; resolving is a Security framework round trip
+        self._resolved_paths = {}
     
     def store_folder_path(self, key: str, folder_path: str) -> bool:
         """
@@ -208,6 +232,9 @@ class BookmarkAwareSettings:
         Returns:
             True if stored successfully
         """
+        # The folder changed; forget the previously resolved one
+        self.cleanup_security_scoped_access(key)
+        
         if SecurityScopedBookmarkManager.is_available():
             # Create security-scoped bookmark
             bookmark_data = SecurityScopedBookmarkManager.create_bookmark(folder_path)
@@ -235,18 +262,28 @@ class BookmarkAwareSettings:
         Returns:
             Folder path if available and accessible, None otherwise
         """
+        # Bookmarks are resolved and access started once per session
+        if key in self._resolved_paths:
+            return self._resolved_paths[key]
+        
         if SecurityScopedBookmarkManager.is_available():
             # Try to resolve bookmark first
             bookmark_data = self.settings.value(f"{key}_bookmark")
             if bookmark_data:
-                result = SecurityScopedBookmarkManager.resolve_bookmark(bookmark_data)
+                result = SecurityScopedBookmarkManager.resolve_bookmark_with_staleness(bookmark_data)
                 if result:
-                    folder_path, security_scoped_url = result
+                    folder_path, security_scoped_url, is_stale = result
                     
                     # Start accessing the security-scoped resource
                     if SecurityScopedBookmarkManager.start_accessing_url(security_scoped_url):
+                        if is_stale:
+                            # Replace the stale bookmark so the next launch
+                            # resolves a fresh one instead of failing
+                            self.store_folder_path(key, folder_path)
+                        
                         # Store the active URL for later cleanup
                         self._active_urls[key] = security_scoped_url
+                        self._resolved_paths[key] = folder_path
                         return folder_path
                     else:
                         print(f"Failed to start accessing security-scoped resource for {key}")
@@ -264,6 +301,7 @@ class BookmarkAwareSettings:
             key: Specific key to cleanup, or None to cleanup all
         """
         if key:
+            self._resolved_paths.pop(key, None)
             if key in self._active_urls:
                 SecurityScopedBookmarkManager.stop_accessing_url(self._active_urls[key])
                 del self._active_urls[key]
@@ -272,6 +310,11 @@ class BookmarkAwareSettings:
             for active_key, url in self._active_urls.items():
                 SecurityScopedBookmarkManager.stop_accessing_url(url)
             self._active_urls.clear()
+            self._resolved_paths.clear()
+    
+    def release_all(self) -> None:
+        """Stop accessing every security-scoped folder; call when the app quits."""
+        self.cleanup_security_scoped_access()
     
     def __del__(self):
         """Cleanup all security-scoped access when the object is destroyed."""
@@ -5,11 +5,19 @@ Provides robust validation for application settings using Pydantic models.
 """
 
 import os
+import re
 from pathlib import Path
 from typing import Optional
 from pydantic import BaseModel, Field, validator, ValidationError
 from urllib.parse import urlparse
 
+# Longest n8n API key accepted by APISettings
+API_KEY_MAX_LENGTH = 200
+
+# Compiled once; validators run on every save
+_API_KEY_WHITESPACE_PATTERN = re.compile(r'[ \n\r\t]')
+_MODEL_ID_PATTERN = re.compile(r'^[a-zA-Z0-9._-]+$')
+
 
 class AudioFolderSettings(BaseModel):
     """Validation model for audio folder settings"""
@@ -57,11 +65,11 @@ class APISettings(BaseModel):
             if len(v) < 10:
                 raise ValueError("API key appears to be too short (minimum 10 characters)")
             
-            if len(v) > 200:
-                raise ValueError("API key appears to be too long (maximum 200 characters)")
+            if len(v) > API_KEY_MAX_LENGTH:
+                raise ValueError(f"API key appears to be too long (maximum {API_KEY_MAX_LENGTH} characters)")
             
             # Check for obviously invalid characters
-            if any(char in v for char in [' ', '\n', '\r', '\t']):
+            if _API_KEY_WHITESPACE_PATTERN.search(v):
                 raise ValueError("API key contains invalid whitespace characters")
         
         return v
@@ -104,8 +112,7 @@ class WhisperModelSettings(BaseModel):
             raise ValueError("Model ID cannot be empty")
         
         # Basic format validation - model IDs should be alphanumeric with dots/dashes
-        import re
-        if not re.match(r'^[a-zA-Z0-9._-]+$', v):
+        if not _MODEL_ID_PATTERN.match(v):
             raise ValueError("Model ID contains invalid characters")
         
         return v.strip()
@@ -222,7 +229,7 @@ class SettingsValidator:
     
     @classmethod
     def validate_api_settings(cls, api_key: str = None, base_url: str = None) -> ValidationResult:
-        """Validate API settings"""
+        """Validate API settings; pure, with no network or file access"""
         errors = []
         warnings = []
         
@@ -11,7 +11,7 @@ US2: UI View & State Management
 
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Set
 from enum import Enum
 import logging
 
@@ -24,7 +24,6 @@ from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QWidget
 from app.services.voice_memo_parser import VoiceMemoModel
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -91,6 +90,10 @@ class VoiceMemoTableModel(QAbstractTableModel):
     COL_SIZE = 3
     COL_STATUS = 4
     
+    # Role returning (transcription_status, transcription_progress,
+    # transcription_error) in one call, for the transcription delegates
+    TRANSCRIPTION_STATE_ROLE = Qt.ItemDataRole.UserRole + 2
+    
     # Column headers
     HEADERS = [
         "Title",
@@ -103,10 +106,25 @@ class VoiceMemoTableModel(QAbstractTableModel):
     def __init__(self, state_manager: VoiceMemoStateManager, parent=None):
         super().__init__(parent)
         self._memos: List[VoiceMemoModel] = []
+        # Lowercased searchable text per row, parallel to _memos
+        self._search_texts: List[str] = []
+        # Sort key per sortable column for each row, parallel to _memos
+        self._sort_keys: List[Dict[int, Any]] = []
+        # Formatted Date Created text per row, parallel to _memos
+        self._date_texts: List[str] = []
+        # Current sort (newest first until the user picks a column), kept
+        # across reloads and re-applied when the sort column's text changes
+        self._sort_column = self.COL_DATE
+        self._sort_order = Qt.SortOrder.DescendingOrder
+        # Lowercased display text per row for a sort column without a
+        # precomputed key (Status), parallel to _memos; None otherwise
+        self._display_sort_keys: Optional[List[str]] = None
+        self._resort_pending = False
         self._state_manager = state_manager
         
         # Connect to state changes
         self._state_manager.status_changed.connect(self._on_status_changed)
+        self.dataChanged.connect(self._on_data_changed)
         
         logger.info("✅ Voice Memo Table Model initialized")
     
@@ -134,6 +152,9 @@ class VoiceMemoTableModel(QAbstractTableModel):
         column = index.column()
         
         if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.COL_DATE:
+                # Formatted once per load; strftime per paint adds up
+                return self._date_texts[index.row()]
             return self._get_display_data(memo, column)
         elif role == Qt.ItemDataRole.ToolTipRole:
             return self._get_tooltip_data(memo, column)
@@ -149,6 +170,9 @@ class VoiceMemoTableModel(QAbstractTableModel):
             # Return the status for this memo
             memo_id = self._get_memo_id(memo)
             return self._state_manager.get_status(memo_id)
+        elif role == self.TRANSCRIPTION_STATE_ROLE:
+            return (memo.transcription_status, memo.transcription_progress or '',
+                    memo.transcription_error)
         
         return None
     
@@ -277,8 +301,11 @@ class VoiceMemoTableModel(QAbstractTableModel):
         """Set the list of memos to display"""
         self.beginResetModel()
         
-        # Sort memos by creation date (newest first)
+        # Sort memos by creation date (newest first), then by the current sort
         self._memos = sorted(memos, key=lambda memo: memo.creation_date, reverse=True)
+        self._search_texts = [self._build_search_text(memo) for memo in self._memos]
+        self._sort_keys = [self._build_sort_keys(memo) for memo in self._memos]
+        self._date_texts = [self._get_display_data(memo, self.COL_DATE) for memo in self._memos]
         
         # Initialize all memos as "NEW" status
         for memo in self._memos:
@@ -287,8 +314,10 @@ class VoiceMemoTableModel(QAbstractTableModel):
                 # Only set if not already set (preserve existing statuses)
                 self._state_manager.set_status(memo_id, VoiceMemoStatus.NEW)
         
+        self._reorder_rows(self._sort_column, self._sort_order)
+        
         self.endResetModel()
-        logger.info(f"📊 Model updated with {len(self._memos)} Voice Memos (sorted by date)")
+        logger.info(f"📊 Model updated with {len(self._memos)} Voice Memos (sorted by column {self._sort_column})")
     
     def get_memo_at_row(self, row: int) -> Optional[VoiceMemoModel]:
         """Get the memo at the specified row"""
@@ -296,6 +325,155 @@ class VoiceMemoTableModel(QAbstractTableModel):
             return self._memos[row]
         return None
     
+    def find_rows_containing(self, needle: str) -> Set[int]:
+        """
+        Find the rows whose search text contains a lowercased needle.
+        
+        Args:
+            needle: Lowercased text to look for
+            
+        Returns:
+            Set of matching row numbers
+        """
+        return {row for row, text in enumerate(self._search_texts) if needle in text}
+    
+    def get_search_text_at_row(self, row: int) -> str:
+        """
+        Get the lowercased text a search matches against for a row.
+        
+        Args:
+            row: Row in this model
+            
+        Returns:
+            Title, file path and dates joined by newlines, or "" for an invalid row
+        """
+        if 0 <= row < len(self._search_texts):
+            return self._search_texts[row]
+        return ""
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """
+        Sort the memos in place with list sorting on the precomputed keys.
+        
+        Sorting here keeps the comparisons in CPython's sort instead of
+        calling a Python lessThan from Qt for every comparison. The sort is
+        stable, and missing durations and sizes sort as 0.
+        
+        Args:
+            column: Column to sort by
+            order: Ascending or descending
+        """
+        if not (0 <= column < len(self.HEADERS)):
+            return
+        self._sort_column = column
+        self._sort_order = order
+        if not self._memos:
+            return
+        
+        self.layoutAboutToBeChanged.emit()
+        new_order = self._reorder_rows(column, order)
+        
+        # Keep selections and other persistent indexes on the same memos
+        new_rows = [0] * len(new_order)
+        for new_row, old_row in enumerate(new_order):
+            new_rows[old_row] = new_row
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_rows[index.row()], index.column()) for index in old_indexes]
+        )
+        
+        self.layoutChanged.emit()
+    
+    def _reorder_rows(self, column: int, order: Qt.SortOrder) -> List[int]:
+        """
+        Reorder the memos and their per-row caches without notifying views.
+        
+        Args:
+            column: Column to sort by
+            order: Ascending or descending
+            
+        Returns:
+            The permutation applied: new_order[new_row] = old_row
+        """
+        if not self._memos or column in self._sort_keys[0]:
+            sort_keys = [keys[column] for keys in self._sort_keys]
+            display_sort_keys = None
+        else:
+            # No precomputed key (e.g. Status); compare the display text
+            sort_keys = display_sort_keys = [self._display_sort_key(memo, column) for memo in self._memos]
+        
+        new_order = sorted(range(len(self._memos)), key=sort_keys.__getitem__,
+                           reverse=(order == Qt.SortOrder.DescendingOrder))
+        self._memos = [self._memos[row] for row in new_order]
+        self._search_texts = [self._search_texts[row] for row in new_order]
+        self._sort_keys = [self._sort_keys[row] for row in new_order]
+        self._date_texts = [self._date_texts[row] for row in new_order]
+        if display_sort_keys is not None:
+            display_sort_keys = [display_sort_keys[row] for row in new_order]
+        self._display_sort_keys = display_sort_keys
+        return new_order
+    
+    def _display_sort_key(self, memo: VoiceMemoModel, column: int) -> str:
+        """Sort key for a column without a precomputed one: its lowercased text"""
+        return str(self._get_display_data(memo, column)).lower()
+    
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=()) -> None:
+        """Schedule a re-sort when a changed row's sort key no longer matches"""
+        # Precomputed keys (title, date, duration, size) only change on reload
+        if self._resort_pending or self._display_sort_keys is None:
+            return
+        if not (top_left.column() <= self._sort_column <= bottom_right.column()):
+            return
+        rows = range(top_left.row(), min(bottom_right.row() + 1, len(self._memos)))
+        if all(self._display_sort_key(self._memos[row], self._sort_column) == self._display_sort_keys[row]
+               for row in rows):
+            return
+        # Deferred so every dataChanged receiver sees the rows it was given
+        self._resort_pending = True
+        QTimer.singleShot(0, self._resort)
+    
+    def _resort(self) -> None:
+        """Re-apply the current sort, e.g. after status changes"""
+        self._resort_pending = False
+        if self._sort_column != -1:
+            self.sort(self._sort_column, self._sort_order)
+    
+    def get_sort_key(self, row: int, column: int) -> Any:
+        """
+        Get the value a row sorts by in a column.
+        
+        Args:
+            row: Row in this model
+            column: Column being sorted
+            
+        Returns:
+            The sort key, or None for an invalid row or a column without one
+        """
+        if 0 <= row < len(self._sort_keys):
+            return self._sort_keys[row].get(column)
+        return None
+    
+    @classmethod
+    def _build_sort_keys(cls, memo: VoiceMemoModel) -> Dict[int, Any]:
+        """Build a memo's per-column sort keys; missing duration and size sort as 0"""
+        return {
+            cls.COL_TITLE: memo.get_display_title().lower(),
+            cls.COL_DATE: memo.creation_date,
+            cls.COL_DURATION: memo.duration if memo.duration else 0,
+            cls.COL_SIZE: memo.file_size if memo.file_size else 0,
+        }
+    
+    @staticmethod
+    def _build_search_text(memo: VoiceMemoModel) -> str:
+        """Build the searchable text for a memo; built once per load, not per keystroke"""
+        return "\n".join([
+            memo.get_display_title().lower(),
+            str(memo.file_path).lower() if memo.file_path else "",  # Convert PosixPath to string
+            memo.creation_date.strftime("%Y-%m-%d %H:%M").lower(),
+            memo.creation_date.strftime("%d-%b-%y").lower(),  # Also search in formatted date
+        ])
+    
     def refresh_memo_statuses(self) -> None:
         """Refresh the display of all memo statuses"""
         if self._memos:
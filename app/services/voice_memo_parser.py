@@ -3,7 +3,7 @@
 Voice Memo Data Source & Parsing Module for AudioTransLocal
 
 This module handles efficient reading and interpretation of Voice Memos data
-from the macOS Voice Memos SQLite database using SQLAlchemy 2.0 with async support
+from the macOS Voice Memos SQLite database using aiosqlite for non-blocking access
 and Pydantic V2 for robust data validation.
 
 Epic 2: Voice Memo Browse & Management
@@ -11,38 +11,129 @@ US1: Data Source & Parsing
 """
 
 import asyncio
+import os
 import sqlite3
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple, Union
+from typing import List, Optional, Dict, Any, Tuple, Union, Iterator
 import logging
 from dataclasses import dataclass
 
-# SQLAlchemy 2.0 with async support
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import String, Integer, Float, DateTime, select, text
-from sqlalchemy.exc import SQLAlchemyError
+# Async SQLite access (read-only scan, no ORM mapping needed)
+import aiosqlite
 
 # Pydantic V2 for data validation
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from pydantic.types import UUID4
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Core Data timestamps count seconds from this reference date
+_CORE_DATA_EPOCH = datetime(2001, 1, 1)
+
+# Table holding the recordings in current Voice Memos databases
+_DEFAULT_RECORDING_TABLE = "ZCLOUDRECORDING"
+
+# Recordings table resolved by exploration, keyed by database path, for
+# databases where the default table is missing or empty
+_TABLE_NAME_CACHE: Dict[str, str] = {}
+
+# Columns the parser actually reads, as candidate names per logical field
+# (matched case-insensitively against the discovered table schema). Raw
+# records are tuples with one value per field, in this order.
+_RECORD_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'path': ('zpath', 'path'),
+    'custom_label': ('zcustomlabel', 'customlabel'),
+    'encrypted_title': ('zencryptedtitle', 'encryptedtitle'),
+    'date': ('zdate', 'date', 'creationdate'),
+    'duration': ('zduration', 'duration'),
+    'uuid': ('zuuid', 'uuid', 'id'),
+}
+
+# Position of the creation date in raw record tuples
+_DATE_FIELD_INDEX = list(_RECORD_FIELDS).index('date')
+
+
+def _core_data_to_datetimes(values: List[Any]) -> List[Any]:
+    """
+    Convert a column of Core Data timestamps to datetimes in one batch.
+    
+    The arithmetic runs as a single vectorized NumPy operation instead of a
+    datetime + timedelta per record. Entries that are not non-zero numbers
+    (None, strings, ...) or fall outside the datetime range are returned
+    unchanged so the per-record fallbacks still apply to them.
+    
+    Args:
+        values: Raw ZDATE values, one per record
+        
+    Returns:
+        List of the same length with numeric timestamps replaced by datetimes
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return values
+    
+    numeric = [i for i, v in enumerate(values)
+               if v and isinstance(v, (int, float)) and not isinstance(v, bool)]
+    if not numeric:
+        return values
+    
+    seconds = np.fromiter((values[i] for i in numeric), dtype=np.float64, count=len(numeric))
+    with np.errstate(invalid='ignore', over='ignore'):
+        micros = np.rint(seconds * 1e6).astype('timedelta64[us]')
+    stamps = (np.datetime64(_CORE_DATA_EPOCH, 'us') + micros).tolist()
+    
+    converted = list(values)
+    for i, stamp in zip(numeric, stamps):
+        # Out-of-range results come back as ints (or None for NaT)
+        if isinstance(stamp, datetime):
+            converted[i] = stamp
+    return converted
+
+
+def _walk_m4a(root: Union[str, Path]) -> Iterator[os.DirEntry]:
+    """
+    Yield every .m4a file below root using os.scandir.
+    
+    DirEntry objects carry the name and cached stat data from the directory
+    read itself, so this is much cheaper than Path.rglob on large trees.
+    
+    Args:
+        root: Directory to walk recursively
+        
+    Yields:
+        os.DirEntry for each .m4a file found
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith('.m4a'):
+                        yield entry
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {directory}: {e}")
+
 
 class VoiceMemoModel(BaseModel):
     """
     Pydantic V2 model for Voice Memo data validation and type enforcement.
     
     This model ensures all Voice Memo data is properly validated and typed
-    before being used throughout the application.
+    before being used throughout the application. Validation happens once
+    at construction; later attribute updates (file cross-referencing,
+    transcription status) are trusted internal writes and are not
+    re-validated.
     """
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        validate_assignment=False,
         frozen=False
     )
     
@@ -87,8 +178,7 @@ class VoiceMemoModel(BaseModel):
             # Core Data timestamps: seconds since 2001-01-01 00:00:00 UTC
             # This is the format used by macOS Voice Memos database
             try:
-                core_data_epoch = datetime(2001, 1, 1)
-                return core_data_epoch + timedelta(seconds=v)
+                return _CORE_DATA_EPOCH + timedelta(seconds=v)
             except (ValueError, OverflowError):
                 # Fallback to Unix timestamp if Core Data conversion fails
                 try:
@@ -141,8 +231,9 @@ class VoiceMemoDatabase:
     """
     Async database interface for Voice Memos SQLite database.
     
-    Uses SQLAlchemy 2.0 with asyncio to ensure database operations
-    never block the main UI thread.
+    Uses aiosqlite directly to ensure database operations never block
+    the main UI thread. The scan is a plain read-only query, so rows are
+    consumed as plain tuples without any ORM or expression layer.
     """
     
     def __init__(self, db_path: Path):
@@ -153,8 +244,11 @@ class VoiceMemoDatabase:
             db_path: Path to the Recordings.db SQLite file
         """
         self.db_path = db_path
-        self.engine = None
-        self.async_session = None
+        # Single connection shared by every query of one parse
+        self._conn: Optional[aiosqlite.Connection] = None
+        # Table column behind each _RECORD_FIELDS entry of the last fetch
+        # (None where the table has no match), in record order
+        self.record_columns: List[Optional[str]] = [None] * len(_RECORD_FIELDS)
         
     async def connect(self) -> bool:
         """
@@ -164,25 +258,10 @@ class VoiceMemoDatabase:
             True if connection successful, False otherwise
         """
         try:
-            # Create async engine for SQLite
-            db_url = f"sqlite+aiosqlite:///{self.db_path}"
-            self.engine = create_async_engine(
-                db_url,
-                echo=False,  # Set to True for SQL debugging
-                pool_pre_ping=True
-            )
-            
-            # Create session factory
-            self.async_session = async_sessionmaker(
-                self.engine,
-                class_=AsyncSession,
-                expire_on_commit=False
-            )
-            
-            # Test the connection
-            async with self.async_session() as session:
-                result = await session.execute(text("SELECT 1"))
-                result.fetchone()
+            # Open the connection used for the rest of the parse
+            self._conn = await aiosqlite.connect(self.db_path)
+            # We only ever read from the Voice Memos database
+            await self._conn.execute("PRAGMA query_only = ON")
             
             logger.info(f"✅ Connected to Voice Memos database: {self.db_path}")
             return True
@@ -201,93 +280,138 @@ class VoiceMemoDatabase:
         table_info = {}
         
         try:
-            async with self.async_session() as session:
-                # Get table names
-                result = await session.execute(text(
-                    "SELECT name FROM sqlite_master WHERE type='table'"
-                ))
-                tables = result.fetchall()
-                
-                for (table_name,) in tables:
-                    # Get column info for each table
-                    result = await session.execute(text(f"PRAGMA table_info({table_name})"))
-                    columns = result.fetchall()
-                    table_info[table_name] = [col[1] for col in columns]  # col[1] is column name
-                
-                logger.info(f"📊 Found {len(table_info)} tables in database")
-                return table_info
-                
+            # Get table names
+            async with self._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            ) as cursor:
+                tables = await cursor.fetchall()
+            
+            for (table_name,) in tables:
+                # Get column info for each table
+                async with self._conn.execute(f"PRAGMA table_info({table_name})") as cursor:
+                    columns = await cursor.fetchall()
+                table_info[table_name] = [col[1] for col in columns]  # col[1] is column name
+            
+            logger.info(f"📊 Found {len(table_info)} tables in database")
+            return table_info
+            
         except Exception as e:
             logger.error(f"❌ Failed to get table info: {e}")
             return {}
     
-    async def fetch_voice_memos_raw(self) -> List[Dict[str, Any]]:
+    async def fetch_voice_memos_raw(self) -> List[Tuple[Any, ...]]:
         """
         Fetch raw voice memo data from the database.
         
         Returns:
-            List of dictionaries containing raw database records
+            List of tuples with one value per _RECORD_FIELDS entry (None
+            where the table has no matching column)
         """
         try:
-            async with self.async_session() as session:
-                # First, let's explore the database structure
-                table_info = await self.get_table_info()
-                logger.info(f"📋 Available tables: {list(table_info.keys())}")
-                
-                # Look for the most likely table containing recordings
-                recording_tables = [
-                    name for name in table_info.keys() 
-                    if any(keyword in name.lower() for keyword in ['recording', 'memo', 'voice', 'cloudrecording'])
-                ]
-                
-                if not recording_tables:
-                    # Fallback: try known table names from Voice Memos database
-                    recording_tables = ['ZCLOUDRECORDING', 'ZRECORDING', 'recordings']
-                
-                logger.info(f"🎙️  Trying recording tables: {recording_tables}")
-                
-                # Try each potential table
-                for table_name in recording_tables:
-                    try:
-                        # Get a sample to understand the structure
-                        result = await session.execute(text(f"SELECT * FROM {table_name} LIMIT 5"))
-                        sample_rows = result.fetchall()
+            # Try the table we expect (or resolved last time) before exploring
+            cache_key = str(self.db_path)
+            known_table = _TABLE_NAME_CACHE.get(cache_key, _DEFAULT_RECORDING_TABLE)
+            try:
+                records = await self._fetch_from_table(known_table)
+                if records is not None:
+                    return records
+            except sqlite3.Error as e:
+                logger.debug(f"Known table {known_table} not usable, exploring database: {e}")
+            
+            # Explore the database structure
+            table_info = await self.get_table_info()
+            logger.info(f"📋 Available tables: {list(table_info.keys())}")
+            
+            # Look for the most likely table containing recordings
+            recording_tables = [
+                name for name in table_info.keys() 
+                if any(keyword in name.lower() for keyword in ['recording', 'memo', 'voice', 'cloudrecording'])
+            ]
+            
+            if not recording_tables:
+                # Fallback: try known table names from Voice Memos database
+                recording_tables = ['ZCLOUDRECORDING', 'ZRECORDING', 'recordings']
+            
+            logger.info(f"🎙️  Trying recording tables: {recording_tables}")
+            
+            # Try each potential table
+            for table_name in recording_tables:
+                if table_name == known_table:
+                    continue
+                try:
+                    records = await self._fetch_from_table(table_name)
+                    if records is not None:
+                        _TABLE_NAME_CACHE[cache_key] = table_name
+                        return records
                         
-                        if sample_rows:
-                            logger.info(f"✅ Found data in table: {table_name}")
-                            
-                            # Get all columns
-                            columns = list(sample_rows[0]._mapping.keys())
-                            logger.info(f"📝 Columns: {columns}")
-                            
-                            # Fetch all records
-                            result = await session.execute(text(f"SELECT * FROM {table_name}"))
-                            all_rows = result.fetchall()
-                            
-                            # Convert to dictionaries
-                            records = []
-                            for row in all_rows:
-                                record = dict(row._mapping)
-                                records.append(record)
-                            
-                            logger.info(f"📊 Fetched {len(records)} records from {table_name}")
-                            return records
-                            
-                    except Exception as e:
-                        logger.warning(f"⚠️  Failed to query table {table_name}: {e}")
-                        continue
-                
-                logger.warning("❌ No suitable recording table found")
-                return []
-                
+                except Exception as e:
+                    logger.warning(f"⚠️  Failed to query table {table_name}: {e}")
+                    continue
+            
+            logger.warning("❌ No suitable recording table found")
+            return []
+            
         except Exception as e:
             logger.error(f"❌ Failed to fetch voice memos: {e}")
             return []
     
+    async def _fetch_from_table(self, table_name: str) -> Optional[List[Tuple[Any, ...]]]:
+        """
+        Fetch all records from one candidate recordings table.
+        
+        Args:
+            table_name: Name of the table to read
+            
+        Returns:
+            List of projected record tuples, or None if the table is empty
+        """
+        # Get a sample to understand the structure
+        async with self._conn.execute(f"SELECT * FROM {table_name} LIMIT 5") as cursor:
+            sample_rows = await cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+        
+        if not sample_rows:
+            return None
+        
+        logger.info(f"✅ Found data in table: {table_name}")
+        logger.info(f"📝 Columns: {columns}")
+        
+        # Select exactly the parser's fields, in _RECORD_FIELDS order,
+        # so every row arrives as a fixed-shape tuple
+        matched = self._match_columns(columns)
+        cols_sql = ", ".join(f'"{col}"' if col else "NULL" for col in matched)
+        
+        # Fetch all records
+        async with self._conn.execute(f"SELECT {cols_sql} FROM {table_name}") as cursor:
+            records = await cursor.fetchall()
+        self.record_columns = matched
+        
+        logger.info(f"📊 Fetched {len(records)} records from {table_name}")
+        return records
+    
+    @staticmethod
+    def _match_columns(columns: List[str]) -> List[Optional[str]]:
+        """
+        Find the table column backing each field in _RECORD_FIELDS.
+        
+        Args:
+            columns: Column names of the recordings table
+            
+        Returns:
+            One entry per logical field: the matching column name as spelled
+            in the table, or None if the table has none
+        """
+        col_lookup = {col.lower(): col for col in columns}
+        return [
+            next((col_lookup[c] for c in candidates if c in col_lookup), None)
+            for candidates in _RECORD_FIELDS.values()
+        ]
+    
     async def close(self):
         """Close the database connection"""
-        if self.engine:
-            await self.engine.dispose()
+        if self._conn:
+            await self._conn.close()
+            self._conn = None
             logger.info("🔒 Database connection closed")
 
 
@@ -307,6 +431,8 @@ class VoiceMemoParser:
         self.voice_memos_folder = Path(voice_memos_folder)
         self.db_path = self.voice_memos_folder / "CloudRecordings.db"  # Correct database name
         self.database = VoiceMemoDatabase(self.db_path)
+        # Lazily built list of .m4a files used by the fallback file lookup
+        self._m4a_index: Optional[List[os.DirEntry]] = None
         
     async def load_voice_memos(self) -> List[VoiceMemoModel]:
         """
@@ -322,6 +448,7 @@ class VoiceMemoParser:
             List of validated VoiceMemoModel instances
         """
         voice_memos = []
+        self._m4a_index = None
         
         try:
             # Step 1: Connect to database
@@ -341,10 +468,16 @@ class VoiceMemoParser:
             # Step 3: Process and validate each record
             logger.info(f"🔍 Processing {len(raw_records)} records...")
             
+            # Shared fallback creation date for records without one
+            now = datetime.now()
+            
+            # Convert all Core Data timestamps up front in one batch
+            creation_dates = _core_data_to_datetimes([record[_DATE_FIELD_INDEX] for record in raw_records])
+            
             for i, raw_record in enumerate(raw_records):
                 try:
                     # Parse the raw database record into our Pydantic model
-                    voice_memo = await self._parse_raw_record(raw_record)
+                    voice_memo = await self._parse_raw_record(raw_record, now, creation_dates[i])
                     
                     if voice_memo:
                         voice_memos.append(voice_memo)
@@ -365,29 +498,30 @@ class VoiceMemoParser:
         
         return voice_memos
     
-    async def _parse_raw_record(self, raw_record: Dict[str, Any]) -> Optional[VoiceMemoModel]:
+    async def _parse_raw_record(self, raw_record: Tuple[Any, ...],
+                                now: Optional[datetime] = None,
+                                creation_date: Any = None) -> Optional[VoiceMemoModel]:
         """
         Parse a raw database record into a validated VoiceMemoModel.
         
         Args:
-            raw_record: Raw dictionary from database query
+            raw_record: Raw tuple from database query, in _RECORD_FIELDS order
+            now: Creation date to use when the record has none (computed
+                once per batch by load_voice_memos)
+            creation_date: Pre-converted ZDATE value from
+                _core_data_to_datetimes; defaults to the raw column value
             
         Returns:
             VoiceMemoModel instance or None if parsing failed
         """
         try:
-            # Extract key fields using the correct Voice Memos database schema
-            # Based on CloudRecordings.db structure
-            
-            # Primary fields from ZCLOUDRECORDING table
-            path_field = self._find_field(raw_record, ['zpath', 'ZPATH', 'path'])
-            title_field = self._find_field(raw_record, ['zcustomlabel', 'ZCUSTOMLABEL', 'customlabel'])
-            encrypted_title_field = self._find_field(raw_record, ['zencryptedtitle', 'ZENCRYPTEDTITLE', 'encryptedtitle'])
-            date_field = self._find_field(raw_record, ['zdate', 'ZDATE', 'date', 'creationdate'])
-            duration_field = self._find_field(raw_record, ['zduration', 'ZDURATION', 'duration'])
+            # Fields from the ZCLOUDRECORDING table, already projected by the query
+            (path_field, title_field, encrypted_title_field,
+             date_field, duration_field, uuid_field) = raw_record
+            if creation_date is not None:
+                date_field = creation_date
             
             # Generate a UUID from path or other unique identifier if available
-            uuid_field = self._find_field(raw_record, ['zuuid', 'ZUUID', 'uuid', 'id'])
             if not uuid_field and path_field:
                 # Generate UUID from path for consistency
                 import hashlib
@@ -411,9 +545,11 @@ class VoiceMemoParser:
             if not display_title:
                 if date_field:
                     try:
-                        if isinstance(date_field, (int, float)):
+                        if isinstance(date_field, datetime):
+                            display_title = f"Voice Memo {date_field.strftime('%Y-%m-%d %H:%M')}"
+                        elif isinstance(date_field, (int, float)):
                             # Core Data timestamp - convert to readable date
-                            readable_date = datetime(2001, 1, 1) + timedelta(seconds=date_field)
+                            readable_date = _CORE_DATA_EPOCH + timedelta(seconds=date_field)
                             display_title = f"Voice Memo {readable_date.strftime('%Y-%m-%d %H:%M')}"
                         else:
                             display_title = f"Voice Memo {date_field}"
@@ -426,10 +562,15 @@ class VoiceMemoParser:
             memo_data = {
                 'uuid': str(uuid_field),
                 'title': str(display_title),
-                'creation_date': date_field or datetime.now(),
+                'creation_date': date_field or now or datetime.now(),
                 'modification_date': None,  # Not typically stored in Voice Memos DB
                 'duration': float(duration_field) if duration_field and duration_field != 0 else None,
-                'db_data': raw_record
+                # Keyed by the table's own column names (e.g. 'ZPATH')
+                'db_data': {
+                    column: value
+                    for column, value in zip(self.database.record_columns, raw_record)
+                    if column
+                }
             }
             
             # Create the model (this will trigger Pydantic validation)
@@ -448,29 +589,6 @@ class VoiceMemoParser:
             logger.debug(f"Raw record: {raw_record}")
             return None
     
-    def _find_field(self, record: Dict[str, Any], field_names: List[str]) -> Any:
-        """
-        Find a field value by trying multiple possible field names.
-        
-        Args:
-            record: Database record dictionary
-            field_names: List of possible field names to try
-            
-        Returns:
-            Field value or None if not found
-        """
-        for field_name in field_names:
-            # Try exact match
-            if field_name in record:
-                return record[field_name]
-            
-            # Try case-insensitive match
-            for key, value in record.items():
-                if key.lower() == field_name.lower():
-                    return value
-        
-        return None
-    
     async def _cross_reference_file(self, voice_memo: VoiceMemoModel) -> None:
         """
         Cross-reference the Voice Memo with its corresponding .m4a file on disk.
@@ -496,22 +614,20 @@ class VoiceMemoParser:
                     return
             
             # Fallback: search for .m4a files that might match
-            # Look for .m4a files with UUID in name or any .m4a files
-            possible_patterns = [
-                f"*{voice_memo.uuid}*.m4a",
-                "*.m4a"
-            ]
+            # Prefer a file with the UUID in its name, otherwise any .m4a file
+            if self._m4a_index is None:
+                self._m4a_index = list(_walk_m4a(self.voice_memos_folder))
             
-            for pattern in possible_patterns:
-                m4a_files = list(self.voice_memos_folder.rglob(pattern))
-                if m4a_files:
-                    # Use the first match
-                    file_path = m4a_files[0]
-                    voice_memo.file_path = file_path
-                    voice_memo.file_exists = True
-                    voice_memo.file_size = file_path.stat().st_size
-                    logger.debug(f"📁 Found file (fallback) for {voice_memo.get_display_title()}: {file_path.name}")
-                    break
+            match = next((entry for entry in self._m4a_index if voice_memo.uuid in entry.name), None)
+            if match is None and self._m4a_index:
+                match = self._m4a_index[0]
+            
+            if match is not None:
+                file_path = Path(match.path)
+                voice_memo.file_path = file_path
+                voice_memo.file_exists = True
+                voice_memo.file_size = match.stat().st_size
+                logger.debug(f"📁 Found file (fallback) for {voice_memo.get_display_title()}: {file_path.name}")
             
             if not voice_memo.file_exists:
                 logger.debug(f"❌ No file found for {voice_memo.get_display_title()} (ZPATH: {zpath})")
@@ -522,6 +638,25 @@ class VoiceMemoParser:
 
 # Convenience functions for easy integration
 
+# Event loop shared by every load_voice_memos_sync call, running in a daemon thread
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="VoiceMemoParserLoop",
+                daemon=True
+            ).start()
+            _background_loop = loop
+    return _background_loop
+
 async def load_voice_memos_async(voice_memos_folder: Union[str, Path]) -> List[VoiceMemoModel]:
     """
     Convenience function to load Voice Memos asynchronously.
@@ -538,7 +673,12 @@ async def load_voice_memos_async(voice_memos_folder: Union[str, Path]) -> List[V
 
 def load_voice_memos_sync(voice_memos_folder: Union[str, Path]) -> List[VoiceMemoModel]:
     """
-    Convenience function to load Voice Memos synchronously (runs async in event loop).
+    Convenience function to load Voice Memos synchronously.
+    
+    The coroutine runs on a shared background event loop, so this works
+    whether or not the caller already has a running loop and never builds
+    a new loop or thread per call. Async callers should prefer awaiting
+    load_voice_memos_async directly.
     
     Args:
         voice_memos_folder: Path to the Voice Memos folder
@@ -546,22 +686,11 @@ def load_voice_memos_sync(voice_memos_folder: Union[str, Path]) -> List[VoiceMem
     Returns:
         List of VoiceMemoModel instances
     """
-    try:
-        # Try to get existing event loop
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If loop is running, we need to create a task
-            # This is typically used when called from async context
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, load_voice_memos_async(voice_memos_folder))
-                return future.result()
-        else:
-            # Loop exists but not running, can use it directly
-            return loop.run_until_complete(load_voice_memos_async(voice_memos_folder))
-    except RuntimeError:
-        # No event loop, create a new one
-        return asyncio.run(load_voice_memos_async(voice_memos_folder))
+    future = asyncio.run_coroutine_threadsafe(
+        load_voice_memos_async(voice_memos_folder),
+        _get_background_loop()
+    )
+    return future.result()
 
 
 # Test function
@@ -614,4 +743,5 @@ async def test_voice_memo_parsing():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(test_voice_memo_parsing())
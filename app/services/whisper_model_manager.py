@@ -11,18 +11,207 @@ This module centralizes all Whisper model management including:
 Epic 3: Core Transcription Workflow - Model Management
 """
 
+import functools
+import hmac
 import logging
+import os
 from pathlib import Path
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Union, TYPE_CHECKING
 
-from PySide6.QtCore import QSettings, QObject, Signal
-from pydantic import ValidationError
+from PySide6.QtCore import QSettings, QObject, Signal, QRunnable, QThreadPool
 
-from app.models.whisper_model import WhisperModelConfig, WhisperModel
+if TYPE_CHECKING:
+    # Imported lazily at runtime so importing this module (e.g. for the
+    # hashing helpers) does not pull in Pydantic
+    from app.models.whisper_model import WhisperModelConfig, WhisperModel
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Sidecar recording (size, mtime_ns, algorithm, digest) of the last
+# successful verification of a model file
+VERIFIED_MARKER_SUFFIX = ".verified"
+
+# Read size for the hashing fallback when the file cannot be memory-mapped
+_HASH_BUFFER_SIZE = 1024 * 1024
+
+# Window passed to each sha256 update() when hashing a memory-mapped file;
+# hashlib releases the GIL for every window
+_MMAP_WINDOW_SIZE = 16 * 1024 * 1024
+
+# Shard size behind the optional per-shard "sha256_tree" model checksums
+SHA256_SHARD_SIZE = 256 * 1024 * 1024
+
+
+def sha256_file(file_path: Union[str, Path]):
+    """
+    Compute the SHA256 hash of a file.
+    
+    The file is memory-mapped and hashed in place, so its pages go straight
+    from the page cache to OpenSSL without being copied into Python bytes
+    objects. If mapping fails, hashlib.file_digest (Python 3.11+) or a
+    readinto() loop over a single preallocated 1 MiB buffer is used instead.
+    
+    Args:
+        file_path: Path to the file to hash
+        
+    Returns:
+        hashlib sha256 object holding the file's digest
+    """
+    import hashlib
+    import mmap
+    
+    with open(file_path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        
+        if hasattr(os, "posix_fadvise"):
+            # Ask the kernel for aggressive readahead
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        if size:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    sha256_hash = hashlib.sha256()
+                    with memoryview(mapped) as view:
+                        for offset in range(0, size, _MMAP_WINDOW_SIZE):
+                            next_offset = offset + _MMAP_WINDOW_SIZE
+                            if next_offset < size and hasattr(mmap, "MADV_WILLNEED"):
+                                # Start reading the next window while this one is hashed
+                                mapped.madvise(mmap.MADV_WILLNEED, next_offset,
+                                               min(_MMAP_WINDOW_SIZE, size - next_offset))
+                            sha256_hash.update(view[offset:next_offset])
+                    return sha256_hash
+            except (OSError, ValueError) as e:
+                logger.debug(f"mmap hashing unavailable for {file_path}: {e}")
+        
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256")
+        
+        sha256_hash = hashlib.sha256()
+        buffer = bytearray(_HASH_BUFFER_SIZE)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            sha256_hash.update(view[:size])
+        return sha256_hash
+
+
+def sha256_shards(file_path: Union[str, Path], shard_size: int = SHA256_SHARD_SIZE) -> List[str]:
+    """
+    Compute the SHA256 hex digest of each fixed-size shard of a file in parallel.
+    
+    SHA256 itself is sequential, but independent shards are not: each
+    shard of the memory-mapped file is hashed on its own worker thread
+    (hashlib releases the GIL), so large models verify at memory
+    bandwidth instead of single-core hash speed.
+    
+    Args:
+        file_path: Path to the file to hash
+        shard_size: Bytes per shard
+        
+    Returns:
+        List of shard digests in file order (empty for an empty file)
+    """
+    import hashlib
+    import mmap
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with open(file_path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return []
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                def hash_shard(offset: int) -> str:
+                    return hashlib.sha256(view[offset:offset + shard_size]).hexdigest()
+                
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                    return list(pool.map(hash_shard, range(0, size, shard_size)))
+
+
+def blake3_file(file_path: Union[str, Path]) -> Optional[str]:
+    """
+    Compute the BLAKE3 hex digest of a file, if the blake3 package is installed.
+    
+    BLAKE3 is SIMD- and multi-thread-parallel, so this is several times
+    faster than SHA256 on large model files.
+    
+    Args:
+        file_path: Path to the file to hash
+        
+    Returns:
+        Hex digest, or None if blake3 is not available
+    """
+    try:
+        import blake3
+    except ImportError:
+        return None
+    
+    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    hasher.update_mmap(file_path)
+    return hasher.hexdigest()
+
+
+# Built-in models used when whisper_models.json is missing or invalid
+_FALLBACK_MODELS = {
+    "tiny": {
+        "display_name": "Tiny",
+        "filename": "ggml-tiny.bin",
+        "download_url": "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-tiny.bin",
+        "size_mb": 75,
+        "sha256": "be07e048e1e599ad46341c8d2a135645097a538221678b7acdd1b1919c6e1b21",
+        "description": "Fastest model, multilingual support"
+    },
+    "base": {
+        "display_name": "Base",
+        "filename": "ggml-base.bin",
+        "download_url": "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-base.bin",
+        "size_mb": 142,
+        "sha256": "465707469ff3a37a2b9b8d8f89f2f99de7299dac7e3e8fe0aa3b15a1a9df7f39",
+        "description": "Good balance of speed and accuracy"
+    }
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fallback_config() -> "WhisperModelConfig":
+    """
+    Get the validated fallback model configuration.
+    
+    Validated once on first use and shared afterwards; built lazily rather
+    than at import time so this module still does not import Pydantic.
+    
+    Returns:
+        WhisperModelConfig for the built-in models, or an empty config if
+        they fail validation
+    """
+    from pydantic import ValidationError
+    from app.models.whisper_model import WhisperModelConfig
+    
+    try:
+        return WhisperModelConfig(whisper_models=_FALLBACK_MODELS)
+    except ValidationError as e:
+        logger.error(f"❌ Failed to create fallback config: {e}")
+        # Create minimal empty config as last resort
+        return WhisperModelConfig(whisper_models={})
+
+
+class _ModelVerificationTask(QRunnable):
+    """Runs WhisperModelManager.verify_model_integrity off the GUI thread"""
+    
+    def __init__(self, manager: "WhisperModelManager", model_id: str):
+        super().__init__()
+        self.manager = manager
+        self.model_id = model_id
+    
+    def run(self):
+        """Verify the model and report the result"""
+        is_valid = self.manager.verify_model_integrity(self.model_id)
+        self.manager.verification_completed.emit(self.model_id, is_valid)
+
 
 class WhisperModelManager(QObject):
     """
@@ -34,14 +223,30 @@ class WhisperModelManager(QObject):
     
     # Signal emitted when the selected model changes
     model_changed = Signal(str)  # model_id
+    
+    # Signal emitted when an asynchronous integrity check finishes
+    verification_completed = Signal(str, bool)  # model_id, is_valid
+    
+    # Selected model ID, read from QSettings once and then kept in sync by
+    # set_current_model(); shared so every manager instance sees changes
+    _current_model: Optional[str] = None
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.settings = QSettings()
-        self._models_config: Optional[WhisperModelConfig] = None
+        self._models_config: Optional["WhisperModelConfig"] = None
         self._models_dir = Path.home() / "Library" / "Application Support" / "AudioTransLocal" / "models"
         self._models_dir.mkdir(parents=True, exist_ok=True)
+        # Plain string form for the os-level calls on the UI status path;
+        # Path is only handed out through get_models_directory()
+        self._models_dir_str = str(self._models_dir)
+        # Lookups derived once from the immutable models config
+        self._model_by_id: Dict[str, "WhisperModel"] = {}
+        self._available_models: List[Tuple[str, str]] = []
+        self._model_paths: Dict[str, str] = {}
         self._load_models_config()
+        if WhisperModelManager._current_model is None:
+            WhisperModelManager._current_model = self.settings.value("transcription/selected_model", "tiny")
         
     def get_models_directory(self) -> Path:
         """Get the directory where models are stored"""
@@ -49,6 +254,9 @@ class WhisperModelManager(QObject):
     
     def _load_models_config(self):
         """Load models configuration using Pydantic validation"""
+        from pydantic import ValidationError
+        from app.models.whisper_model import WhisperModelConfig
+        
         try:
             # Try resources directory first
             models_file = Path(__file__).parent.parent.parent / "resources" / "whisper_models.json"
@@ -66,37 +274,26 @@ class WhisperModelManager(QObject):
         except Exception as e:
             logger.error(f"❌ Failed to load models config: {e}")
             self._create_fallback_config()
+        
+        self._index_models()
+    
+    def _index_models(self):
+        """Precompute the model lookups served to the UI"""
+        models = self._models_config.whisper_models if self._models_config else {}
+        self._model_by_id = dict(models)
+        self._available_models = [
+            (model_id, f"{model.display_name} ({model.size_mb} MB)")
+            for model_id, model in models.items()
+        ]
+        self._model_paths = {
+            model_id: os.path.join(self._models_dir_str, model.filename)
+            for model_id, model in models.items()
+        }
     
     def _create_fallback_config(self):
         """Create a minimal fallback configuration"""
-        fallback_data = {
-            "whisper_models": {
-                "tiny": {
-                    "display_name": "Tiny",
-                    "filename": "ggml-tiny.bin",
-                    "download_url": "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-tiny.bin",
-                    "size_mb": 75,
-                    "sha256": "be07e048e1e599ad46341c8d2a135645097a538221678b7acdd1b1919c6e1b21",
-                    "description": "Fastest model, multilingual support"
-                },
-                "base": {
-                    "display_name": "Base",
-                    "filename": "ggml-base.bin", 
-                    "download_url": "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-base.bin",
-                    "size_mb": 142,
-                    "sha256": "465707469ff3a37a2b9b8d8f89f2f99de7299dac7e3e8fe0aa3b15a1a9df7f39",
-                    "description": "Good balance of speed and accuracy"
-                }
-            }
-        }
-        
-        try:
-            self._models_config = WhisperModelConfig(**fallback_data)
-            logger.info("✅ Created fallback model configuration")
-        except ValidationError as e:
-            logger.error(f"❌ Failed to create fallback config: {e}")
-            # Create minimal empty config as last resort
-            self._models_config = WhisperModelConfig(whisper_models={})
+        self._models_config = _get_fallback_config()
+        logger.info("✅ Using fallback model configuration")
     
     def get_available_models(self) -> List[Tuple[str, str]]:
         """
@@ -105,18 +302,9 @@ class WhisperModelManager(QObject):
         Returns:
             List of (model_id, display_name) tuples
         """
-        if not self._models_config:
-            return []
-        
-        model_list = []
-        
-        for model_id, model in self._models_config.whisper_models.items():
-            display_name = f"{model.display_name} ({model.size_mb} MB)"
-            model_list.append((model_id, display_name))
-        
-        return model_list
+        return list(self._available_models)
     
-    def get_model_info(self, model_id: str) -> Optional[WhisperModel]:
+    def get_model_info(self, model_id: str) -> Optional["WhisperModel"]:
         """
         Get detailed information about a specific model.
         
@@ -126,10 +314,7 @@ class WhisperModelManager(QObject):
         Returns:
             WhisperModel instance with validated data, or None if not found
         """
-        if not self._models_config:
-            return None
-        
-        return self._models_config.get_model(model_id)
+        return self._model_by_id.get(model_id)
     
     
     def is_model_downloaded(self, model_id: str) -> bool:
@@ -146,18 +331,27 @@ class WhisperModelManager(QObject):
         if not model:
             return False
             
-        # Check for ggml model file in our application's models directory
-        model_file = self._models_dir / model.filename
+        # Check for ggml model file in our application's models directory and
+        # verify it has a reasonable size (> 1MB to avoid empty files)
+        return self._get_model_file_size(model.filename) > 1024 * 1024  # At least 1MB
+    
+    def _get_model_file_size(self, filename: str) -> int:
+        """
+        Get the current size of a file in the models directory.
         
-        # Verify file exists and has reasonable size (> 1MB to avoid empty files)
-        if model_file.exists():
-            try:
-                file_size = model_file.stat().st_size
-                return file_size > 1024 * 1024  # At least 1MB
-            except OSError:
-                return False
+        A single os.stat per call, so a file still growing in place (e.g.
+        mid-download) always reports its real size.
         
-        return False
+        Args:
+            filename: Name of the file inside the models directory
+            
+        Returns:
+            Size in bytes, or 0 if the file does not exist
+        """
+        try:
+            return os.stat(os.path.join(self._models_dir_str, filename)).st_size
+        except OSError:
+            return 0
 
     def get_model_status_text(self, model_id: str) -> str:
         """
@@ -177,10 +371,39 @@ class WhisperModelManager(QObject):
             return "Downloaded"
         else:
             return f"Not downloaded ({model.size_mb} MB)"
+    
+    def get_all_statuses(self) -> List[Tuple[str, str, str]]:
+        """
+        Get the download status of every model in one pass.
+        
+        Equivalent to calling get_model_status_text() for each model, but
+        the sizes come from a single os.scandir pass over the models
+        directory instead of one stat per model.
+        
+        Returns:
+            List of (model_id, display_name, status_text) tuples
+        """
+        sizes = {}
+        try:
+            with os.scandir(self._models_dir_str) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        sizes[entry.name] = entry.stat().st_size
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to scan models directory: {e}")
+        
+        statuses = []
+        for model_id, model in self._model_by_id.items():
+            if sizes.get(model.filename, 0) > 1024 * 1024:
+                status_text = "Downloaded"
+            else:
+                status_text = f"Not downloaded ({model.size_mb} MB)"
+            statuses.append((model_id, model.display_name, status_text))
+        return statuses
 
     def get_current_model(self) -> str:
         """Get the currently selected model ID"""
-        return self.settings.value("transcription/selected_model", "tiny")
+        return WhisperModelManager._current_model
 
     def set_current_model(self, model_id: str) -> bool:
         """
@@ -192,14 +415,13 @@ class WhisperModelManager(QObject):
         Returns:
             True if model was set successfully, False otherwise
         """
-        available_model_ids = [mid for mid, _ in self.get_available_models()]
-        if model_id not in available_model_ids:
+        if model_id not in self._model_by_id:
             logger.error(f"❌ Model not available: {model_id}")
             return False
         
-        # Save to settings
+        # Save to settings (QSettings flushes to disk on its own and at exit)
+        WhisperModelManager._current_model = model_id
         self.settings.setValue("transcription/selected_model", model_id)
-        self.settings.sync()
         
         logger.info(f"✅ Selected model: {model_id}")
         self.model_changed.emit(model_id)
@@ -219,15 +441,15 @@ class WhisperModelManager(QObject):
         if not model:
             return None
         
-        destination_path = self._models_dir / model.filename
-        
         return {
             "model_id": model_id,
             "download_url": str(model.download_url),
-            "destination_path": str(destination_path),
+            "destination_path": self._model_paths[model_id],
             "filename": model.filename,
             "size_mb": model.size_mb,
             "sha256": model.sha256,
+            "blake3": model.blake3,
+            "sha256_tree": model.sha256_tree,
             "display_name": model.display_name
         }
     
@@ -235,6 +457,11 @@ class WhisperModelManager(QObject):
         """
         Verify the integrity of a downloaded model using SHA256 checksum.
         
+        When the model config carries a BLAKE3 checksum and the blake3
+        package is installed, that much faster hash is checked instead.
+        Otherwise per-shard SHA256 digests ("sha256_tree") are verified in
+        parallel when configured, and the whole-file SHA256 is the fallback.
+        
         Args:
             model_id: The model identifier
             
@@ -250,24 +477,146 @@ class WhisperModelManager(QObject):
             # If no checksum is provided, just check file existence
             return self.is_model_downloaded(model_id)
         
-        model_file = Path(download_info["destination_path"])
-        if not model_file.exists():
+        model_file = download_info["destination_path"]
+        try:
+            st = os.stat(model_file)
+        except OSError:
+            return False
+        if st.st_size == 0:
             return False
         
+        # Skip re-hashing when a previous verification of this exact file
+        # (same size and mtime) is on record against a checksum that is
+        # still the configured one for the algorithm that verified it
+        marker_file = model_file + VERIFIED_MARKER_SUFFIX
+        marker = self._read_verified_marker(marker_file)
+        if marker is not None:
+            size, mtime_ns, algorithm, digest = marker
+            if ((size, mtime_ns) == (st.st_size, st.st_mtime_ns)
+                    and self._expected_digests(download_info).get(algorithm) == digest):
+                return True
+        
         try:
-            import hashlib
-            sha256_hash = hashlib.sha256()
-            with open(model_file, "rb") as f:
-                # Read file in chunks to handle large files
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            
-            calculated_sha256 = sha256_hash.hexdigest()
-            return calculated_sha256.lower() == expected_sha256.lower()
-            
+            verified_by = self._check_model_digest(model_id, download_info, model_file)
         except Exception as e:
             logger.error(f"❌ Failed to verify model integrity: {e}")
             return False
+        
+        if verified_by is None:
+            return False
+        self._write_verified_marker(marker_file, st, *verified_by)
+        return True
+    
+    def verify_model_integrity_async(self, model_id: str):
+        """
+        Verify a model's integrity on the global thread pool.
+        
+        Returns immediately; the result of verify_model_integrity() is
+        delivered through the verification_completed signal, so hashing a
+        multi-GB model never blocks the GUI thread.
+        
+        Args:
+            model_id: The model identifier
+        """
+        QThreadPool.globalInstance().start(_ModelVerificationTask(self, model_id))
+    
+    @staticmethod
+    def _expected_digests(download_info: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Get the configured checksums of a model, keyed by algorithm.
+        
+        Per-shard "sha256_tree" digests are joined with commas so every
+        algorithm maps to a single string.
+        
+        Args:
+            download_info: Download info as returned by get_model_download_info
+            
+        Returns:
+            Dictionary mapping algorithm name to lowercase expected digest
+        """
+        digests = {}
+        if download_info.get("blake3"):
+            digests["blake3"] = download_info["blake3"].lower()
+        if download_info.get("sha256_tree"):
+            digests["sha256_tree"] = ",".join(download_info["sha256_tree"]).lower()
+        if download_info.get("sha256"):
+            digests["sha256"] = download_info["sha256"].lower()
+        return digests
+    
+    def _check_model_digest(self, model_id: str, download_info: Dict[str, Any],
+                            model_file: str) -> Optional[Tuple[str, str]]:
+        """
+        Hash a model file and compare it against its configured checksums.
+        
+        Args:
+            model_id: The model identifier
+            download_info: Download info as returned by get_model_download_info
+            model_file: Path of the downloaded model file
+            
+        Returns:
+            (algorithm, expected digest) that the file matched, or None if
+            it does not match its checksum
+        """
+        expected = self._expected_digests(download_info)
+        
+        if "blake3" in expected:
+            calculated_blake3 = blake3_file(model_file)
+            if calculated_blake3 is not None:
+                return ("blake3", expected["blake3"]) if calculated_blake3 == expected["blake3"] else None
+        
+        if "sha256_tree" in expected:
+            calculated_tree = ",".join(sha256_shards(model_file))
+            return ("sha256_tree", expected["sha256_tree"]) if calculated_tree == expected["sha256_tree"] else None
+        
+        try:
+            expected_digest = bytes.fromhex(expected["sha256"])
+        except ValueError:
+            logger.error(f"❌ Invalid SHA256 checksum configured for model: {model_id}")
+            return None
+        if len(expected_digest) != 32:
+            return None
+        
+        sha256_hash = sha256_file(model_file)
+        if not hmac.compare_digest(expected_digest, sha256_hash.digest()):
+            return None
+        return "sha256", expected["sha256"]
+    
+    @staticmethod
+    def _read_verified_marker(marker_file: str) -> Optional[Tuple[int, int, str, str]]:
+        """
+        Read a ".verified" sidecar written by a previous verification.
+        
+        Args:
+            marker_file: Path of the sidecar file
+            
+        Returns:
+            (size, mtime_ns, algorithm, digest) tuple, or None if missing or
+            malformed
+        """
+        try:
+            with open(marker_file, "r", encoding="ascii") as f:
+                size, mtime_ns, algorithm, digest = f.read().split()
+            return int(size), int(mtime_ns), algorithm, digest.lower()
+        except (OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def _write_verified_marker(marker_file: str, st: os.stat_result, algorithm: str, digest: str):
+        """
+        Record a successful verification next to the model file.
+        
+        Args:
+            marker_file: Path of the sidecar file
+            st: stat result of the model file that was verified
+            algorithm: Checksum algorithm that verified the file
+            digest: The expected checksum the file matched
+        """
+        try:
+            with open(marker_file, "w", encoding="ascii") as f:
+                f.write(f"{st.st_size} {st.st_mtime_ns} {algorithm} {digest.lower()}")
+        except OSError as e:
+            # Only a cache; verification simply runs again next time
+            logger.warning(f"⚠️ Could not write verification marker: {e}")
 
     def get_models_by_size_range(self, max_size_mb: Optional[int] = None) -> List[Tuple[str, str]]:
         """
@@ -2,16 +2,68 @@
 Main window for AudioTransLocal application
 """
 
+from __future__ import annotations
+
+import logging
 import os
+import time
 from pathlib import Path
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QMenuBar, 
                               QMessageBox)
-from PySide6.QtCore import Qt, QSettings
+from PySide6.QtCore import Qt, QSettings, QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QKeySequence, QAction
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # View modules are imported where they are first needed, so the window
+    # can be shown without loading Preferences (keychain, bookmarks, model
+    # widget) until it is opened
+    from app.services.transcription_service import TranscriptionProgress, TranscriptionResult
+
+logger = logging.getLogger(__name__)
+
+# Menu shortcuts, built once from key combinations rather than parsed from
+# strings per window. StandardKey sequences are avoided here: resolving them
+# needs a QGuiApplication, which does not exist yet at import time.
+_KS_PREFERENCES = QKeySequence(Qt.CTRL | Qt.Key_Comma)
+_KS_QUIT = QKeySequence(Qt.CTRL | Qt.Key_Q)
+_KS_REFRESH = QKeySequence(Qt.CTRL | Qt.Key_R)
+_KS_TRANSCRIBE = QKeySequence(Qt.CTRL | Qt.Key_T)
+
+# Voice Memos database in its default system location, used when the
+# configured folder has none
+_SYSTEM_VOICE_MEMOS_PATH = Path.home() / "Library/Group Containers/group.com.apple.VoiceMemos.shared/Recordings"
+_SYSTEM_VOICE_MEMOS_DB = str(_SYSTEM_VOICE_MEMOS_PATH / "CloudRecordings.db")
 
-from app.views.voice_memo_view import VoiceMemoView
-from app.views.preferences_window import PreferencesWindow
-from app.services.transcription_service import TranscriptionProgress, TranscriptionResult
+# Transcription progress is forwarded to the view at most this often
+_PROGRESS_FLUSH_INTERVAL_MS = 100
+
+# A database whose mtime is unchanged is not reloaded within this window
+_DB_RELOAD_WINDOW_SECONDS = 10.0
+
+
+class _FileCheckSignals(QObject):
+    """Signals for _FileCheckTask"""
+    
+    finished = Signal(str, bool)  # file_path, exists
+
+
+class _FileCheckTask(QRunnable):
+    """
+    Checks that a file exists on a pool thread.
+    
+    Voice Memos may live on iCloud or a network mount, where a single stat
+    can block for seconds.
+    """
+    
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _FileCheckSignals()
+    
+    def run(self):
+        """Stat the file and report the result"""
+        self.signals.finished.emit(self.file_path, os.path.exists(self.file_path))
 
 
 class MainWindow(QMainWindow):
@@ -19,11 +71,23 @@ class MainWindow(QMainWindow):
     
     def __init__(self, audio_folder_path, whisper_model_manager, credentials_manager, transcription_service):
         super().__init__()
-        self.audio_folder_path = audio_folder_path
+        self._set_audio_folder(audio_folder_path)
         self.whisper_model_manager = whisper_model_manager
         self.credentials_manager = credentials_manager
         self.transcription_service = transcription_service
         self.preferences_window = None
+        self._file_check_task = None
+        # (db_path, mtime_ns) and time of the last database load, to skip
+        # reloading a database that has not changed
+        self._last_db_state = None
+        self._last_db_load_time = 0.0
+        # Latest transcription progress not yet shown; coalesced by a timer
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(_PROGRESS_FLUSH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        # Message boxes, created on first use and reused afterwards
+        self._message_boxes = {}
         
         self.setup_ui()
         self.create_menu_bar()
@@ -44,9 +108,16 @@ class MainWindow(QMainWindow):
         layout.setSpacing(0)
         
         # Add Voice Memo View as the main content
+        from app.views.voice_memo_view import VoiceMemoView
         self.voice_memo_view = VoiceMemoView()
         layout.addWidget(self.voice_memo_view)
         
+        # Optional transcription hooks on the view, looked up once instead of
+        # on every progress signal
+        self._update_transcription_status = getattr(self.voice_memo_view, 'update_transcription_status', None)
+        self._update_transcription_progress = getattr(self.voice_memo_view, 'update_transcription_progress', None)
+        self._update_transcription_result = getattr(self.voice_memo_view, 'update_transcription_result', None)
+        
         central_widget.setLayout(layout)
         
         # Auto-load Voice Memos if we have a valid folder path
@@ -61,7 +132,7 @@ class MainWindow(QMainWindow):
         
         # Preferences action
         preferences_action = QAction("Preferences...", self)
-        preferences_action.setShortcut(QKeySequence("Ctrl+,"))
+        preferences_action.setShortcut(_KS_PREFERENCES)
         preferences_action.triggered.connect(self.show_preferences)
         app_menu.addAction(preferences_action)
         
@@ -69,7 +140,7 @@ class MainWindow(QMainWindow):
         
         # Quit action
         quit_action = QAction("Quit AudioTransLocal", self)
-        quit_action.setShortcut(QKeySequence("Ctrl+Q"))
+        quit_action.setShortcut(_KS_QUIT)
         quit_action.triggered.connect(self.close)
         app_menu.addAction(quit_action)
         
@@ -78,13 +149,13 @@ class MainWindow(QMainWindow):
         
         # Refresh action
         refresh_action = QAction("Refresh Voice Memos", self)
-        refresh_action.setShortcut(QKeySequence("Ctrl+R"))
+        refresh_action.setShortcut(_KS_REFRESH)
         refresh_action.triggered.connect(self._refresh_voice_memos)
         voice_menu.addAction(refresh_action)
         
         # Transcribe selected action
         transcribe_action = QAction("Transcribe Selected", self)
-        transcribe_action.setShortcut(QKeySequence("Ctrl+T"))
+        transcribe_action.setShortcut(_KS_TRANSCRIBE)
         transcribe_action.triggered.connect(self.transcribe_selected_memo)
         voice_menu.addAction(transcribe_action)
     
@@ -96,46 +167,83 @@ class MainWindow(QMainWindow):
     
     def on_transcription_started(self):
         """Handle transcription started signal"""
-        print("🎯 Transcription started")
+        logger.info("🎯 Transcription started")
         # Update UI to show transcription is in progress
-        if hasattr(self.voice_memo_view, 'update_transcription_status'):
-            self.voice_memo_view.update_transcription_status("Starting transcription...")
+        if self._update_transcription_status is not None:
+            self._update_transcription_status("Starting transcription...")
+        if self._update_transcription_progress is not None:
+            self._progress_timer.start()
     
     def on_transcription_progress_updated(self, progress: TranscriptionProgress):
         """Handle transcription progress updates"""
-        print(f"📊 Transcription progress: {progress.percentage}% - {progress.current_step}")
-        # Update UI with progress
-        if hasattr(self.voice_memo_view, 'update_transcription_progress'):
-            self.voice_memo_view.update_transcription_progress(progress)
+        # Only keep the latest value; _flush_progress shows it on the next tick
+        self._pending_progress = progress
+    
+    def _flush_progress(self):
+        """Show the latest pending transcription progress in the view"""
+        progress = self._pending_progress
+        if progress is None:
+            return
+        self._pending_progress = None
+        if self._update_transcription_progress is not None:
+            self._update_transcription_progress(progress)
     
-    def on_transcription_completed(self, result: TranscriptionResult):
+    def on_transcription_completed(self, file_path: str, result: TranscriptionResult):
         """Handle transcription completion"""
+        self._progress_timer.stop()
+        self._flush_progress()
+        
         if result.success:
-            print(f"✅ Transcription completed successfully")
-            print(f"📝 Text: {result.text[:100]}...")
+            logger.info("✅ Transcription completed successfully")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📝 Text: {result.text[:100]}...")
             
             # Show success message
-            QMessageBox.information(
-                self,
+            duration = f"{result.duration:.2f}s" if result.duration else "Unknown"
+            self._show_information(
                 "Transcription Complete",
                 f"Transcription completed successfully!\n\n"
                 f"Language: {result.language or 'Unknown'}\n"
-                f"Duration: {result.duration:.2f}s" if result.duration else "Duration: Unknown"
+                f"Duration: {duration}"
             )
             
             # Update UI
-            if hasattr(self.voice_memo_view, 'update_transcription_result'):
-                self.voice_memo_view.update_transcription_result(result)
+            if self._update_transcription_result is not None:
+                self._update_transcription_result(result)
         else:
-            print(f"❌ Transcription failed: {result.error_message}")
+            logger.error(f"❌ Transcription failed: {result.error_message}")
             
             # Show error message
-            QMessageBox.critical(
-                self,
+            self._show_critical(
                 "Transcription Failed",
                 f"Transcription failed:\n\n{result.error_message}"
             )
     
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str):
+        """
+        Show a modal message using a reused QMessageBox for the given icon.
+        
+        Args:
+            icon: QMessageBox.Information or QMessageBox.Critical
+            title: Window title
+            text: Message text
+        """
+        message_box = self._message_boxes.get(icon)
+        if message_box is None:
+            message_box = QMessageBox(icon, "", "", QMessageBox.Ok, self)
+            self._message_boxes[icon] = message_box
+        message_box.setWindowTitle(title)
+        message_box.setText(text)
+        message_box.exec()
+    
+    def _show_information(self, title: str, text: str):
+        """Show an information message"""
+        self._show_message(QMessageBox.Information, title, text)
+    
+    def _show_critical(self, title: str, text: str):
+        """Show an error message"""
+        self._show_message(QMessageBox.Critical, title, text)
+    
     def transcribe_selected_memo(self):
         """Transcribe the currently selected Voice Memo using the injected service"""
         if not hasattr(self, 'voice_memo_view'):
@@ -143,18 +251,28 @@ class MainWindow(QMainWindow):
         
         selected_memo = self.voice_memo_view.get_selected_memo()
         if not selected_memo:
-            QMessageBox.information(
-                self, 
-                "No Selection", 
+            self._show_information(
+                "No Selection",
                 "Please select a Voice Memo to transcribe."
             )
             return
         
         # Get the audio file path
         audio_file_path = selected_memo.get_file_path()
-        if not audio_file_path or not os.path.exists(audio_file_path):
-            QMessageBox.critical(
-                self,
+        if not audio_file_path:
+            self._on_audio_file_checked(audio_file_path, False)
+            return
+        
+        # Check the file off the GUI thread; transcription starts once it reports back
+        self._file_check_task = _FileCheckTask(audio_file_path)
+        self._file_check_task.signals.finished.connect(self._on_audio_file_checked)
+        QThreadPool.globalInstance().start(self._file_check_task)
+    
+    def _on_audio_file_checked(self, audio_file_path, exists: bool):
+        """Start transcribing a checked audio file, or report that it is missing"""
+        self._file_check_task = None
+        if not exists:
+            self._show_critical(
                 "File Not Found",
                 f"Audio file not found:\n{audio_file_path}"
             )
@@ -163,8 +281,7 @@ class MainWindow(QMainWindow):
         # Start transcription using the injected service
         success = self.transcription_service.start_transcription(audio_file_path)
         if not success:
-            QMessageBox.critical(
-                self,
+            self._show_critical(
                 "Transcription Error",
                 "Failed to start transcription. Please check that a Whisper model is downloaded."
             )
@@ -177,6 +294,7 @@ class MainWindow(QMainWindow):
     def show_preferences(self):
         """Show the preferences window"""
         if self.preferences_window is None:
+            from app.views.preferences_window import PreferencesWindow
             self.preferences_window = PreferencesWindow(
                 whisper_model_manager=self.whisper_model_manager,
                 credentials_manager=self.credentials_manager,
@@ -184,6 +302,12 @@ class MainWindow(QMainWindow):
             )
             # Connect the folder changed signal
             self.preferences_window.folder_changed.connect(self.update_folder_display)
+            # Closing only hides the window, so its widgets (including the
+            # model widget) are built once and reused for later opens
+            self.preferences_window.setAttribute(Qt.WA_DeleteOnClose, False)
+        elif not self.preferences_window.isVisible():
+            # Reopening: only the two stored values need re-reading
+            self.preferences_window.refresh()
         
         # Show the preferences window (non-modal)
         self.preferences_window.show()
@@ -192,24 +316,70 @@ class MainWindow(QMainWindow):
         
     def _load_voice_memos(self):
         """Load Voice Memos from the configured audio folder"""
-        if not self.audio_folder_path:
+        if not self._db_path:
             return
         
         # Check for Voice Memos database
-        folder_path = Path(self.audio_folder_path)
-        db_path = folder_path / "CloudRecordings.db"
-        
-        if db_path.exists():
-            print(f"📂 Loading Voice Memos from: {db_path}")
-            self.voice_memo_view.load_voice_memos(str(db_path))
+        db_path = self._db_path
+        db_mtime_ns = self._get_db_mtime_ns(db_path)
+        if db_mtime_ns is not None:
+            if self._should_reload_db(db_path, db_mtime_ns):
+                logger.info(f"📂 Loading Voice Memos from: {db_path}")
+                self.voice_memo_view.load_voice_memos(db_path)
         else:
             # Check if this is the actual Voice Memos folder
-            voice_memos_path = Path.home() / "Library/Group Containers/group.com.apple.VoiceMemos.shared/Recordings"
-            if voice_memos_path.exists() and (voice_memos_path / "CloudRecordings.db").exists():
-                print(f"📂 Loading Voice Memos from system location: {voice_memos_path}")
-                self.voice_memo_view.load_voice_memos(str(voice_memos_path / "CloudRecordings.db"))
+            db_mtime_ns = self._get_db_mtime_ns(_SYSTEM_VOICE_MEMOS_DB)
+            if db_mtime_ns is not None and self._should_reload_db(_SYSTEM_VOICE_MEMOS_DB, db_mtime_ns):
+                logger.info(f"📂 Loading Voice Memos from system location: {_SYSTEM_VOICE_MEMOS_PATH}")
+                self.voice_memo_view.load_voice_memos(_SYSTEM_VOICE_MEMOS_DB)
+    
+    @staticmethod
+    def _get_db_mtime_ns(db_path: str):
+        """
+        Get the modification time of a Voice Memos database.
+        
+        Recent changes may only be in the SQLite write-ahead log, so the
+        newer of the database and its -wal file is used.
+        
+        Returns:
+            mtime in nanoseconds, or None if the database does not exist
+        """
+        try:
+            mtime_ns = os.stat(db_path).st_mtime_ns
+        except OSError:
+            return None
+        try:
+            return max(mtime_ns, os.stat(f"{db_path}-wal").st_mtime_ns)
+        except OSError:
+            return mtime_ns
+    
+    def _should_reload_db(self, db_path: str, db_mtime_ns: int) -> bool:
+        """
+        Decide whether a Voice Memos database needs to be (re)loaded.
+        
+        Records the load when it returns True.
+        
+        Returns:
+            False if the same database was loaded unchanged within the last
+            _DB_RELOAD_WINDOW_SECONDS, True otherwise
+        """
+        db_state = (db_path, db_mtime_ns)
+        now = time.monotonic()
+        if db_state == self._last_db_state and now - self._last_db_load_time < _DB_RELOAD_WINDOW_SECONDS:
+            return False
+        
+        self._last_db_state = db_state
+        self._last_db_load_time = now
+        return True
     
     def update_folder_display(self, folder_path):
         """Update the folder display and reload Voice Memos"""
-        self.audio_folder_path = folder_path
+        if folder_path != self.audio_folder_path:
+            self._last_db_state = None
+        self._set_audio_folder(folder_path)
         self._load_voice_memos()
+    
+    def _set_audio_folder(self, folder_path):
+        """Store the audio folder and the database path derived from it"""
+        self.audio_folder_path = folder_path
+        self._db_path = os.path.join(folder_path, "CloudRecordings.db") if folder_path else None
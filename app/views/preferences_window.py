@@ -3,17 +3,62 @@
 Preferences window for AudioTransLocal application
 """
 
-import os
+import logging
+import time
+from pathlib import Path
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, 
-                            QWidget, QGroupBox, QFormLayout, QLineEdit, 
-                            QPushButton, QLabel, QComboBox, QProgressBar,
-                            QMessageBox, QFileDialog)
-from PySide6.QtCore import Qt, QSettings, Signal
-from resources.styles import apply_style
-from app.services.validation import SettingsValidator
-from app.services.macos_bookmarks import BookmarkAwareSettings
+                            QWidget, QGroupBox, QLineEdit, QPushButton, QLabel,
+                            QMessageBox, QFileDialog, QProgressDialog)
+from PySide6.QtCore import Qt, QSettings, Signal, QObject, QRunnable, QThreadPool, QSignalBlocker
+from resources.styles import apply_styles
+from app.services.validation import SettingsValidator, ValidationResult, API_KEY_MAX_LENGTH
 from app.views.whisper_model_widget import WhisperModelWidget
 
+logger = logging.getLogger(__name__)
+
+
+# How long a resolved default folder for the change-folder dialog is reused
+_DEFAULT_FOLDER_TTL_SECONDS = 60.0
+
+
+# Folders the change-folder dialog may start in, resolved once at import
+_HOME = Path.home()
+_VOICE_MEMOS_DIR = _HOME / "Library/Group Containers/group.com.apple.VoiceMemos.shared/Recordings"
+_LEGACY_VOICE_MEMOS_DIR = _HOME / "Library/Application Support/com.apple.voicememos/Recordings"
+_DOWNLOADS_DIR = _HOME / "Downloads"
+_DEFAULT_FOLDER_CANDIDATES = (_VOICE_MEMOS_DIR, _LEGACY_VOICE_MEMOS_DIR, _DOWNLOADS_DIR)
+
+
+class _BackgroundCallSignals(QObject):
+    """Signals for _BackgroundCall"""
+    
+    finished = Signal(object)  # return value of the call, None if it raised
+
+
+class _BackgroundCall(QRunnable):
+    """
+    Runs a blocking call (Keychain read, folder validation) on a pool thread.
+    
+    The return value is delivered through signals.finished, which is
+    queued back to the receiver's thread. finished always fires; it carries
+    None if the call raised, so receivers can clean up either way.
+    """
+    
+    def __init__(self, func, *args):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.signals = _BackgroundCallSignals()
+    
+    def run(self):
+        """Make the call and report its result"""
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            logger.error(f"❌ Background call {getattr(self.func, '__name__', self.func)} failed: {e}")
+            result = None
+        self.signals.finished.emit(result)
+
 
 class PreferencesWindow(QDialog):
     """Preferences window for application settings"""
@@ -26,16 +71,35 @@ class PreferencesWindow(QDialog):
         self.whisper_model_manager = whisper_model_manager
         self.credentials_manager = credentials_manager
         self.settings = QSettings("AudioTransLocal", "AudioTransLocal")
-        self.bookmark_settings = BookmarkAwareSettings(self.settings)
+        self._bookmark_settings = None
+        self._validation_task = None
+        self._validation_progress = None
+        self._api_key_task = None
+        # Change-folder dialog, built on first use and reused afterwards
+        self._folder_dialog = None
+        # (current_path, default_path, resolved_at) for the change-folder dialog
+        self._default_folder = None
         self.setup_ui()
         self.load_settings()
         
+    @property
+    def bookmark_settings(self):
+        """Bookmark-aware view of the settings, created on first access"""
+        # Deferred: creating it can resolve macOS security-scoped bookmarks
+        if self._bookmark_settings is None:
+            from app.services.macos_bookmarks import BookmarkAwareSettings
+            self._bookmark_settings = BookmarkAwareSettings(self.settings)
+        return self._bookmark_settings
+    
     def setup_ui(self):
         """Setup the preferences window UI"""
         self.setWindowTitle("AudioTransLocal Preferences")
         self.setModal(False)  # Non-modal window
         self.setFixedSize(800, 550)
         
+        # (widget, style) pairs, applied together as one window stylesheet
+        styled_widgets = []
+        
         # Main layout
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(20, 15, 20, 15)
@@ -65,13 +129,13 @@ class PreferencesWindow(QDialog):
         self.folder_path_field = QLineEdit()
         self.folder_path_field.setReadOnly(True)
         self.folder_path_field.setMinimumWidth(400)  # Double the width
-        apply_style(self.folder_path_field, 'input_readonly')
+        styled_widgets.append((self.folder_path_field, 'input_readonly'))
         folder_layout.addWidget(self.folder_path_field)
         
         # Change folder button
         change_folder_btn = QPushButton("Change...")
         change_folder_btn.setFixedHeight(32)  # Standard button height
-        apply_style(change_folder_btn, 'button_primary')
+        styled_widgets.append((change_folder_btn, 'button_primary'))
         change_folder_btn.clicked.connect(self.change_folder)
         folder_layout.addWidget(change_folder_btn)
         
@@ -83,7 +147,7 @@ class PreferencesWindow(QDialog):
         
         # Add help text
         help_text = QLabel("Select the folder containing your audio files (Voice Memos, recordings, etc.)")
-        apply_style(help_text, 'help_text')
+        styled_widgets.append((help_text, 'help_text'))
         help_text.setWordWrap(True)
         help_text.setContentsMargins(0, 5, 0, 0)  # Removed left margin of 120
         folder_group_layout.addWidget(help_text)
@@ -108,27 +172,27 @@ class PreferencesWindow(QDialog):
         self.api_key_field.setEchoMode(QLineEdit.Password)
         self.api_key_field.setPlaceholderText("Enter your n8n API key...")
         self.api_key_field.setMinimumWidth(300)  # Double the width
-        apply_style(self.api_key_field, 'input_password')
+        styled_widgets.append((self.api_key_field, 'input_password'))
         api_layout.addWidget(self.api_key_field)
         
         # Show/Hide API key button
         self.show_api_key_btn = QPushButton("Show")
         self.show_api_key_btn.setFixedHeight(32)  # Standard button height
-        apply_style(self.show_api_key_btn, 'button_secondary')
+        styled_widgets.append((self.show_api_key_btn, 'button_secondary'))
         self.show_api_key_btn.clicked.connect(self.toggle_api_key_visibility)
         api_layout.addWidget(self.show_api_key_btn)
         
         # Save button for API key
         save_api_key_btn = QPushButton("Save")
         save_api_key_btn.setFixedHeight(32)  # Standard button height
-        apply_style(save_api_key_btn, 'button_success')
+        styled_widgets.append((save_api_key_btn, 'button_success'))
         save_api_key_btn.clicked.connect(self.save_api_key)
         api_layout.addWidget(save_api_key_btn)
         
         # Clear button for API key
         clear_api_key_btn = QPushButton("Clear")
         clear_api_key_btn.setFixedHeight(32)  # Standard button height
-        apply_style(clear_api_key_btn, 'button_danger')
+        styled_widgets.append((clear_api_key_btn, 'button_danger'))
         clear_api_key_btn.clicked.connect(self.clear_api_key)
         api_layout.addWidget(clear_api_key_btn)
         
@@ -140,7 +204,7 @@ class PreferencesWindow(QDialog):
         
         # Add API key help text
         api_help_text = QLabel("Your n8n API key is stored securely in the macOS Keychain")
-        apply_style(api_help_text, 'help_text')
+        styled_widgets.append((api_help_text, 'help_text'))
         api_help_text.setWordWrap(True)
         api_help_text.setContentsMargins(0, 5, 0, 0)  # Align with window
         api_group_layout.addWidget(api_help_text)
@@ -161,7 +225,7 @@ class PreferencesWindow(QDialog):
         # Close button
         button_layout = QHBoxLayout()
         close_btn = QPushButton("Close")
-        apply_style(close_btn, 'button_secondary')
+        styled_widgets.append((close_btn, 'button_secondary'))
         close_btn.clicked.connect(self.close)
         button_layout.addStretch()
         button_layout.addWidget(close_btn)
@@ -171,23 +235,65 @@ class PreferencesWindow(QDialog):
         main_layout.addLayout(button_layout)
         
         self.setLayout(main_layout)
+        apply_styles(self, styled_widgets)
         
     def load_settings(self):
         """Load current settings into the UI"""
         # Load folder path
         folder_path = self.settings.value("audio_folder_path", "")
-        self.folder_path_field.setText(folder_path)
-        
-        # Load API key from Keychain
-        api_key = self.credentials_manager.get_n8n_api_key()
-        self.api_key_field.setText(api_key)
-        
-        
-        
+        # Loading stored values is not an edit; don't fire textChanged slots
+        with QSignalBlocker(self.folder_path_field):
+            self.folder_path_field.setText(folder_path)
+        
+        # A cached key is shown right away, without an empty-field flash
+        cached_api_key = self.credentials_manager.get_cached_n8n_api_key()
+        if cached_api_key is not None:
+            self._on_api_key_loaded(cached_api_key)
+            return
+        
+        # Load API key from Keychain off the GUI thread; a Keychain read is an
+        # IPC round trip to securityd and the window can paint meanwhile
+        self._api_key_task = _BackgroundCall(self.credentials_manager.get_n8n_api_key)
+        self._api_key_task.signals.finished.connect(self._on_api_key_loaded)
+        QThreadPool.globalInstance().start(self._api_key_task)
+    
+    def refresh(self):
+        """
+        Re-read the folder and API key into an already built window.
+        
+        Used when the window is shown again instead of being rebuilt; edits
+        that were never saved are discarded in favour of the stored values.
+        """
+        self.api_key_field.setModified(False)
+        self.load_settings()
+    
+    def _on_api_key_loaded(self, api_key: str):
+        """Show the API key read from the Keychain"""
+        self._api_key_task = None
+        if api_key is None:
+            return  # The read failed; leave the field as it is
+        # Don't overwrite a key the user started typing before the read finished
+        if not self.api_key_field.isModified():
+            with QSignalBlocker(self.api_key_field):
+                self.api_key_field.setText(api_key)
+    
     def save_api_key(self):
         """Save API key to Keychain with validation"""
         api_key = self.api_key_field.text().strip()
         
+        # Cheap cases first; the full validator only sees plausible keys
+        if not api_key:
+            self._remove_api_key()
+            return
+        
+        if len(api_key) > API_KEY_MAX_LENGTH:
+            QMessageBox.critical(
+                self,
+                "Invalid API Key",
+                f"The API key is not valid:\n\nAPI key appears to be too long (maximum {API_KEY_MAX_LENGTH} characters)\n\nPlease correct the API key and try again."
+            )
+            return
+        
         # Validate API key
         validation_result = SettingsValidator.validate_api_settings(api_key=api_key)
         
@@ -230,28 +336,42 @@ class PreferencesWindow(QDialog):
     
     def clear_api_key(self):
         """Clear API key from both field and Keychain"""
-        reply = QMessageBox.question(
-            self,
+        # Shown with open() rather than exec() so the event loop, and with it
+        # transcription progress in the main window, keeps running meanwhile
+        confirm_box = QMessageBox(
+            QMessageBox.Question,
             "Clear API Key",
             "Are you sure you want to clear your n8n API key?\nThis will remove it from the secure Keychain storage.",
             QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
+            self
         )
-        
+        confirm_box.setDefaultButton(QMessageBox.No)
+        confirm_box.setAttribute(Qt.WA_DeleteOnClose)
+        confirm_box.buttonClicked.connect(
+            lambda button: self._on_clear_confirmed(confirm_box.standardButton(button))
+        )
+        confirm_box.open()
+    
+    def _on_clear_confirmed(self, reply):
+        """Clear the API key if the user confirmed"""
         if reply == QMessageBox.Yes:
-            self.api_key_field.clear()
-            if self.credentials_manager.delete_n8n_api_key():
-                QMessageBox.information(
-                    self,
-                    "API Key Cleared",
-                    "Your n8n API key has been removed from the macOS Keychain."
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Warning",
-                    "API key cleared from field, but there was an issue removing it from Keychain."
-                )
+            self._remove_api_key()
+    
+    def _remove_api_key(self):
+        """Remove the API key from the field and the Keychain, reporting the outcome"""
+        self.api_key_field.clear()
+        if self.credentials_manager.delete_n8n_api_key():
+            QMessageBox.information(
+                self,
+                "API Key Cleared",
+                "Your n8n API key has been removed from the macOS Keychain."
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Warning",
+                "API key cleared from field, but there was an issue removing it from Keychain."
+            )
     
     def toggle_api_key_visibility(self):
         """Toggle between showing and hiding the API key"""
@@ -267,72 +387,118 @@ class PreferencesWindow(QDialog):
     def change_folder(self):
         """Handle folder change button click with validation"""
         current_path = self.settings.value("audio_folder_path", "")
+        default_path = self._get_default_folder(current_path)
+        
+        # Open folder selection dialog; open() returns immediately instead of
+        # spinning a nested event loop while the OS dialog scans slow mounts.
+        # DontUseNativeDialog is deliberately not set: the native panel is
+        # fast on large Recordings folders and grants sandbox access
+        # The dialog is kept between clicks so it is only set up once
+        if self._folder_dialog is None:
+            self._folder_dialog = QFileDialog(self, "Select Audio Files Folder")
+            self._folder_dialog.setFileMode(QFileDialog.Directory)
+            self._folder_dialog.setOptions(QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks)
+            self._folder_dialog.fileSelected.connect(self._on_folder_selected)
+        self._folder_dialog.setDirectory(default_path)
+        self._folder_dialog.open()
+    
+    def _get_default_folder(self, current_path: str) -> str:
+        """
+        Get the folder the change-folder dialog should start in.
         
-        # Get suggested default path
-        voice_memos_path = os.path.expanduser("~/Library/Application Support/com.apple.voicememos/Recordings")
-        downloads_path = os.path.expanduser("~/Downloads")
-        
-        # Use current path if exists, otherwise smart defaults
-        if current_path and os.path.exists(current_path):
-            default_path = current_path
-        elif os.path.exists(voice_memos_path):
-            default_path = voice_memos_path
-        elif os.path.exists(downloads_path):
-            default_path = downloads_path
-        else:
-            default_path = os.path.expanduser("~")
-        
-        # Open folder selection dialog
-        folder_path = QFileDialog.getExistingDirectory(
-            self,
-            "Select Audio Files Folder",
-            default_path,
-            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
-        )
+        The existence checks behind it are reused for
+        _DEFAULT_FOLDER_TTL_SECONDS, so repeated clicks do not stat
+        possibly slow folders again.
         
-        if folder_path:
-            # Validate the selected folder
-            validation_result = SettingsValidator.validate_audio_folder(folder_path)
+        Args:
+            current_path: The currently configured audio folder
             
-            if validation_result.is_valid:
-                # Show warning if Voice Memos database not found
-                if validation_result.has_warnings():
-                    reply = QMessageBox.warning(
-                        self,
-                        "Folder Validation Warning",
-                        validation_result.get_warning_message() + "\n\nDo you want to continue with this folder?",
-                        QMessageBox.Yes | QMessageBox.No,
-                        QMessageBox.Yes
-                    )
-                    
-                    if reply != QMessageBox.Yes:
-                        return  # User chose not to continue
-                
-                # Update settings with validated path
-                validated_path = validation_result.data['folder_path']
-                self.settings.setValue("audio_folder_path", validated_path)
-                self.settings.sync()
-                
-                # Update UI
-                self.folder_path_field.setText(validated_path)
-                
-                # Emit signal to notify main window
-                self.folder_changed.emit(validated_path)
-                
-                # Show confirmation
-                message = f"Audio folder updated to:\n{validated_path}"
-                if validation_result.has_warnings():
-                    message += f"\n\nNote: {validation_result.get_warning_message()}"
-                
-                QMessageBox.information(
-                    self,
-                    "Folder Updated",
-                    message
-                )
-            else:
-                # Show validation errors
-                QMessageBox.critical(
+        Returns:
+            The current folder if it exists, otherwise a sensible default
+        """
+        now = time.monotonic()
+        if self._default_folder is not None:
+            cached_current, cached_default, resolved_at = self._default_folder
+            if cached_current == current_path and now - resolved_at < _DEFAULT_FOLDER_TTL_SECONDS:
+                return cached_default
+        
+        # Use current path if exists, otherwise the first existing smart
+        # default; candidates are only stat'ed until one is found
+        candidates = (Path(current_path),) + _DEFAULT_FOLDER_CANDIDATES if current_path else _DEFAULT_FOLDER_CANDIDATES
+        default_path = str(next((path for path in candidates if path.is_dir()), _HOME))
+        
+        self._default_folder = (current_path, default_path, now)
+        return default_path
+    
+    def _on_folder_selected(self, folder_path):
+        """Validate a folder chosen in the change-folder dialog off the GUI thread"""
+        if not folder_path or self._validation_task is not None:
+            return
+        
+        # Only shown if validation is still running after the minimum duration
+        self._validation_progress = QProgressDialog("Checking folder...", None, 0, 0, self)
+        self._validation_progress.setWindowTitle("Audio Files Folder")
+        self._validation_progress.setWindowModality(Qt.WindowModal)
+        self._validation_progress.setMinimumDuration(500)
+        
+        # Validation stats the folder and looks for CloudRecordings.db, which
+        # can stall on iCloud or network mounts
+        self._validation_task = _BackgroundCall(SettingsValidator.validate_audio_folder, folder_path)
+        self._validation_task.signals.finished.connect(self._apply_validation_result)
+        QThreadPool.globalInstance().start(self._validation_task)
+    
+    def _apply_validation_result(self, validation_result):
+        """Apply a validated folder, or report why it was rejected"""
+        self._validation_task = None
+        self._validation_progress.close()
+        self._validation_progress.deleteLater()
+        self._validation_progress = None
+        
+        if validation_result is None:
+            validation_result = ValidationResult(
+                is_valid=False,
+                errors=["The folder could not be checked. See the log for details."]
+            )
+        
+        if validation_result.is_valid:
+            # Show warning if Voice Memos database not found
+            if validation_result.has_warnings():
+                reply = QMessageBox.warning(
                     self,
-                    "Invalid Folder Selection",
-                    f"The selected folder is not valid:\n\n{validation_result.get_error_message()}\n\nPlease select a different folder."
+                    "Folder Validation Warning",
+                    validation_result.get_warning_message() + "\n\nDo you want to continue with this folder?",
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.Yes
                 )
+                
+                if reply != QMessageBox.Yes:
+                    return  # User chose not to continue
+            
+            # Update settings with validated path (QSettings flushes to disk
+            # on its own and at exit)
+            validated_path = validation_result.data['folder_path']
+            self.settings.setValue("audio_folder_path", validated_path)
+            
+            # Update UI
+            self.folder_path_field.setText(validated_path)
+            
+            # Emit signal to notify main window
+            self.folder_changed.emit(validated_path)
+            
+            # Show confirmation
+            message = f"Audio folder updated to:\n{validated_path}"
+            if validation_result.has_warnings():
+                message += f"\n\nNote: {validation_result.get_warning_message()}"
+            
+            QMessageBox.information(
+                self,
+                "Folder Updated",
+                message
+            )
+        else:
+            # Show validation errors
+            QMessageBox.critical(
+                self,
+                "Invalid Folder Selection",
+                f"The selected folder is not valid:\n\n{validation_result.get_error_message()}\n\nPlease select a different folder."
+            )
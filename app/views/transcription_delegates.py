@@ -9,16 +9,16 @@ action buttons and status indicators.
 Epic 3: Core Transcription Workflow
 """
 
-from pathlib import Path
-from typing import Optional
+from collections import OrderedDict
 
-from PySide6.QtCore import Qt, QRect, QSize, Signal, QEvent, QPoint
-from PySide6.QtGui import QPainter, QFont, QColor, QPen
+from PySide6.QtCore import Qt, QRectF, QSize, Signal, QEvent, QPointF
+from PySide6.QtGui import QPainter, QPainterPath, QFont, QColor, QPen, QPixmap, QStaticText
 from PySide6.QtWidgets import (
-    QStyledItemDelegate, QStyleOptionViewItem, QWidget, QStyle,
-    QPushButton, QHBoxLayout, QApplication, QToolTip
+    QStyledItemDelegate, QWidget, QStyle, QPushButton, QHBoxLayout, QToolTip
 )
 
+from app.services.voice_memo_model import VoiceMemoTableModel
+
 
 class TranscriptionActionsDelegate(QStyledItemDelegate):
     """
@@ -34,6 +34,46 @@ class TranscriptionActionsDelegate(QStyledItemDelegate):
     transcribe_requested = Signal(str)  # memo_id
     view_transcription_requested = Signal(str)  # memo_id
     
+    # Button stylesheet per button kind, shared by every row's button
+    _QSS = {
+        'view': """
+            QPushButton {
+                background-color: #4CAF50;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                font-weight: bold;
+                font-size: 10px;
+            }
+            QPushButton:hover {
+                background-color: #45a049;
+            }
+        """,
+        'transcribe': """
+            QPushButton {
+                background-color: #2196F3;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                font-weight: bold;
+                font-size: 10px;
+            }
+            QPushButton:hover {
+                background-color: #1976D2;
+            }
+        """,
+        'processing': """
+            QPushButton {
+                background-color: #9E9E9E;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                font-weight: bold;
+                font-size: 10px;
+            }
+        """,
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.button_height = 24
@@ -57,55 +97,22 @@ class TranscriptionActionsDelegate(QStyledItemDelegate):
         
         if status == 'transcribed' and hasattr(memo, 'transcription_file_path') and memo.transcription_file_path:
             # Show "View Transcription" button
+            kind = 'view'
             button = QPushButton("View Transcription")
-            button.setFixedSize(self.button_width, self.button_height)
             button.clicked.connect(lambda: self.view_transcription_requested.emit(memo.uuid))
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    font-size: 10px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-            """)
         elif status in ['new', 'error']:
             # Show "Transcribe" button
+            kind = 'transcribe'
             button = QPushButton("Transcribe")
-            button.setFixedSize(self.button_width, self.button_height)
             button.clicked.connect(lambda: self.transcribe_requested.emit(memo.uuid))
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2196F3;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    font-size: 10px;
-                }
-                QPushButton:hover {
-                    background-color: #1976D2;
-                }
-            """)
         else:
             # Show disabled button during processing
+            kind = 'processing'
             button = QPushButton("Processing...")
-            button.setFixedSize(self.button_width, self.button_height)
             button.setEnabled(False)
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #9E9E9E;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    font-size: 10px;
-                }
-            """)
+        
+        button.setFixedSize(self.button_width, self.button_height)
+        button.setStyleSheet(self._QSS[kind])
         
         layout.addWidget(button)
         layout.addStretch()
@@ -131,26 +138,113 @@ class TranscriptionStatusDelegate(QStyledItemDelegate):
     with visual indicators and progress information.
     """
     
+    INDICATOR_SIZE = 12
+    
+    # Status -> (fill color, border color, border width, mark); unknown
+    # statuses use the 'new' look
+    INDICATORS = {
+        'new': ("#9E9E9E", "#757575", 1, None),  # Gray circle for new/ready
+        'transcribing': ("#2196F3", "#1976D2", 1, None),  # Blue circle for processing
+        'transcribed': ("#4CAF50", "#2E7D32", 2, 'check'),  # Green checkmark for completed
+        'error': ("#F44336", "#C62828", 1, 'cross'),  # Red X for error
+    }
+    
+    # Status -> label; 'transcribing' shows its progress text instead and
+    # unknown statuses show their title-cased name
+    LABELS = {
+        'new': "Ready",
+        'transcribed': "Transcribed",
+        'error': "Error",
+    }
+    
+    # Status -> fixed tooltip; other statuses build theirs from their state
+    TOOLTIPS = {
+        'transcribed': "Transcription completed successfully",
+        'new': "Ready for transcription",
+    }
+    
+    # Marks drawn over the indicator circle, in its 12x12 coordinate space
+    _CHECK_PATH = QPainterPath(QPointF(3, 6))
+    _CHECK_PATH.lineTo(5, 8)
+    _CHECK_PATH.lineTo(9, 4)
+    _CROSS_PATH = QPainterPath(QPointF(3, 3))
+    _CROSS_PATH.lineTo(9, 9)
+    _CROSS_PATH.moveTo(9, 3)
+    _CROSS_PATH.lineTo(3, 9)
+    MARK_PATHS = {'check': _CHECK_PATH, 'cross': _CROSS_PATH}
+    
+    # (status, device pixel ratio) -> painted indicator, shared by all delegates
+    _PIXMAPS = {}
+    
+    # Laid-out labels kept; progress labels vary, so the cache is bounded
+    STATIC_TEXT_CACHE_SIZE = 64
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        # (text, italic) -> QStaticText, least recently used first
+        self._static_texts = OrderedDict()
+        # (option font, normal font, italic font), rebuilt if the view's font changes
+        self._fonts = None
+        # (palette cache key, text pen), rebuilt if the palette changes
+        self._text_pen = None
+    
+    @classmethod
+    def _indicator(cls, status: str, dpr: float) -> QPixmap:
+        """
+        Get the indicator for a status, painting it on first use.
+        
+        Args:
+            status: Transcription status
+            dpr: Device pixel ratio of the widget being painted
+            
+        Returns:
+            Pixmap of INDICATOR_SIZE logical pixels square
+        """
+        if status not in cls.INDICATORS:
+            status = 'new'
+        key = (status, dpr)
+        pixmap = cls._PIXMAPS.get(key)
+        if pixmap is not None:
+            return pixmap
+        
+        size = cls.INDICATOR_SIZE
+        pixmap = QPixmap(round(size * dpr), round(size * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        fill, border, border_width, mark = cls.INDICATORS[status]
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(QColor(fill))
+        painter.setPen(QPen(QColor(border), border_width))
+        # Inset by half the pen so the border is not clipped at the edges
+        inset = border_width / 2
+        painter.drawEllipse(QRectF(inset, inset, size - border_width, size - border_width))
+        
+        if mark:
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.setPen(QPen(QColor("white"), 2))
+            painter.drawPath(cls.MARK_PATHS[mark])
+        painter.end()
+        
+        cls._PIXMAPS[key] = pixmap
+        return pixmap
     
     def paint(self, painter, option, index):
         """Custom paint method for status column with visual indicators"""
         painter.save()
         
-        # Get memo and status information
-        memo = index.data(Qt.ItemDataRole.UserRole)
-        if not memo:
+        # Get status information in one lookup
+        state = index.data(VoiceMemoTableModel.TRANSCRIPTION_STATE_ROLE)
+        if not state:
             super().paint(painter, option, index)
             painter.restore()
             return
         
-        status = getattr(memo, 'transcription_status', 'new')
-        progress_text = getattr(memo, 'transcription_progress', '')
+        status, progress_text, _ = state
         
         # Set up painting
         rect = option.rect
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw background for selected/hovered items
         if option.state & QStyle.StateFlag.State_Selected:
@@ -160,94 +254,88 @@ class TranscriptionStatusDelegate(QStyledItemDelegate):
         
         # Draw status indicator and text
         text_rect = rect.adjusted(25, 0, -5, 0)  # Leave space for indicator
-        indicator_rect = QRect(rect.x() + 5, rect.y() + rect.height()//2 - 6, 12, 12)
-        
-        if status == 'new':
-            # Gray circle for new/ready
-            painter.setBrush(QColor("#9E9E9E"))
-            painter.setPen(QPen(QColor("#757575"), 1))
-            painter.drawEllipse(indicator_rect)
-            text = "Ready"
-            
-        elif status == 'transcribing':
-            # Blue animated circle for processing
-            painter.setBrush(QColor("#2196F3"))
-            painter.setPen(QPen(QColor("#1976D2"), 1))
-            painter.drawEllipse(indicator_rect)
+        dpr = option.widget.devicePixelRatioF() if option.widget else painter.device().devicePixelRatioF()
+        painter.drawPixmap(rect.x() + 5, rect.y() + rect.height()//2 - 6, self._indicator(status, dpr))
+        
+        if status == 'transcribing':
             text = progress_text if progress_text else "Transcribing..."
-            
-        elif status == 'transcribed':
-            # Green checkmark for completed
-            painter.setBrush(QColor("#4CAF50"))
-            painter.setPen(QPen(QColor("#2E7D32"), 2))
-            painter.drawEllipse(indicator_rect)
-            # Draw checkmark
-            painter.setPen(QPen(QColor("white"), 2))
-            check_points = [
-                (indicator_rect.x() + 3, indicator_rect.y() + 6),
-                (indicator_rect.x() + 5, indicator_rect.y() + 8),
-                (indicator_rect.x() + 9, indicator_rect.y() + 4)
-            ]
-            for i in range(len(check_points) - 1):
-                painter.drawLine(check_points[i][0], check_points[i][1], 
-                               check_points[i+1][0], check_points[i+1][1])
-            text = "Transcribed"
-            
-        elif status == 'error':
-            # Red X for error
-            painter.setBrush(QColor("#F44336"))
-            painter.setPen(QPen(QColor("#C62828"), 1))
-            painter.drawEllipse(indicator_rect)
-            # Draw X
-            painter.setPen(QPen(QColor("white"), 2))
-            painter.drawLine(indicator_rect.x() + 3, indicator_rect.y() + 3,
-                           indicator_rect.x() + 9, indicator_rect.y() + 9)
-            painter.drawLine(indicator_rect.x() + 9, indicator_rect.y() + 3,
-                           indicator_rect.x() + 3, indicator_rect.y() + 9)
-            text = "Error"
-            
         else:
-            # Default gray for unknown status
-            painter.setBrush(QColor("#9E9E9E"))
-            painter.setPen(QPen(QColor("#757575"), 1))
-            painter.drawEllipse(indicator_rect)
-            text = status.title()
+            text = self.LABELS.get(status) or status.title()
         
         # Draw text
-        painter.setPen(option.palette.text().color())
-        font = QFont(option.font)
-        if status == 'transcribing':
-            font.setItalic(True)
+        painter.setPen(self._pen_for(option.palette))
+        normal_font, italic_font = self._fonts_for(option.font)
+        font = italic_font if status == 'transcribing' else normal_font
         painter.setFont(font)
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
+        static_text = self._static_text(text, font, painter)
+        text_top = text_rect.y() + (text_rect.height() - static_text.size().height()) / 2
+        painter.setClipRect(text_rect)
+        painter.drawStaticText(QPointF(text_rect.x(), text_top), static_text)
         
         painter.restore()
     
+    def _fonts_for(self, option_font: QFont):
+        """Get the (normal, italic) label fonts for the view's font, built once"""
+        if self._fonts is None or self._fonts[0] != option_font:
+            italic_font = QFont(option_font)
+            italic_font.setItalic(True)
+            self._fonts = (QFont(option_font), QFont(option_font), italic_font)
+        return self._fonts[1], self._fonts[2]
+    
+    def _pen_for(self, palette) -> QPen:
+        """Get the label pen for the view's palette, built once"""
+        palette_key = palette.cacheKey()
+        if self._text_pen is None or self._text_pen[0] != palette_key:
+            self._text_pen = (palette_key, QPen(palette.text().color()))
+        return self._text_pen[1]
+    
+    def _static_text(self, text: str, font: QFont, painter: QPainter) -> QStaticText:
+        """
+        Get a label laid out once, so repaints skip text shaping.
+        
+        Args:
+            text: Label text
+            font: Font the label is drawn with
+            painter: Painter the label is drawn with
+            
+        Returns:
+            Prepared QStaticText for the label
+        """
+        key = (text, font.italic())
+        static_text = self._static_texts.get(key)
+        if static_text is not None:
+            self._static_texts.move_to_end(key)
+            return static_text
+        
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.prepare(painter.transform(), font)
+        self._static_texts[key] = static_text
+        if len(self._static_texts) > self.STATIC_TEXT_CACHE_SIZE:
+            self._static_texts.popitem(last=False)
+        return static_text
+    
     def sizeHint(self, option, index):
         """Return appropriate size hint for status column"""
         return QSize(150, 30)
     
     def helpEvent(self, event, view, option, index):
         """Handle tooltip events to show error messages"""
-        if event.type() == QEvent.Type.ToolTip:
-            memo = index.data(Qt.ItemDataRole.UserRole)
-            if memo and hasattr(memo, 'transcription_error') and memo.transcription_error:
-                # Show error message in tooltip
-                QToolTip.showText(event.globalPos(), f"Error: {memo.transcription_error}")
-                return True
-            elif memo and hasattr(memo, 'transcription_status'):
-                status = memo.transcription_status
-                if status == 'transcribed':
-                    tooltip = "Transcription completed successfully"
-                elif status == 'transcribing':
-                    progress = getattr(memo, 'transcription_progress', 'In progress...')
-                    tooltip = f"Status: {progress}"
-                elif status == 'new':
-                    tooltip = "Ready for transcription"
-                else:
-                    tooltip = f"Status: {status}"
-                
-                QToolTip.showText(event.globalPos(), tooltip)
-                return True
-        
-        return super().helpEvent(event, view, option, index)
+        if event.type() != QEvent.Type.ToolTip:
+            return super().helpEvent(event, view, option, index)
+        
+        state = index.data(VoiceMemoTableModel.TRANSCRIPTION_STATE_ROLE)
+        if not state:
+            return super().helpEvent(event, view, option, index)
+        
+        status, progress, error = state
+        if error:
+            # Show error message in tooltip
+            tooltip = f"Error: {error}"
+        elif status == 'transcribing':
+            tooltip = f"Status: {progress or 'In progress...'}"
+        else:
+            tooltip = self.TOOLTIPS.get(status) or f"Status: {status}"
+        
+        QToolTip.showText(event.globalPos(), tooltip)
+        return True
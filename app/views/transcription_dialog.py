@@ -8,17 +8,125 @@ with copy/save functionality.
 Epic 3: Core Transcription Workflow
 """
 
+import functools
+import os
+import re
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal, QMimeData, QByteArray
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
+    QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton,
     QLabel, QDialogButtonBox, QMessageBox, QFileDialog, QFrame
 )
 from PySide6.QtGui import QFont, QIcon
 
 
+# Transcripts longer than this are added to the text area in chunks, so the
+# dialog opens without laying out the whole document first
+CHUNKED_LOAD_THRESHOLD = 64_000
+LOAD_CHUNK_SIZE = 32_000
+
+# Characters dropped from suggested filenames: anything but letters, digits
+# (Unicode included), space, '-', '_' and '.'
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w .-]')
+
+# How long the copy confirmation stays up
+TOAST_DURATION_MS = 1500
+
+# Slice size for writing saved transcripts
+SAVE_BUFFER_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=None)
+def _header_font() -> QFont:
+    """Get the header font, shared by all dialogs (needs a QApplication)"""
+    font = QFont()
+    font.setBold(True)
+    font.setPointSize(14)
+    return font
+
+
+@functools.lru_cache(maxsize=None)
+def _body_font() -> QFont:
+    """Get the transcript font, shared by all dialogs (needs a QApplication)"""
+    return QFont("Arial", 14)  # Increased from 11 to 14
+
+
+def _split_into_chunks(text: str, chunk_size: int) -> list:
+    """
+    Split text into chunks of about chunk_size characters at line breaks.
+    
+    The line break a chunk ends at is dropped, so appending the chunks as
+    paragraphs rebuilds the original text.
+    
+    Args:
+        text: Text to split
+        chunk_size: Target chunk length in characters
+        
+    Returns:
+        List of chunks
+    """
+    chunks = []
+    start = 0
+    while len(text) - start > chunk_size:
+        end = text.rfind('\n', start, start + chunk_size)
+        if end == -1:
+            # A line longer than a chunk; break after it instead
+            end = text.find('\n', start + chunk_size)
+            if end == -1:
+                break
+        chunks.append(text[start:end])
+        start = end + 1
+    chunks.append(text[start:])
+    return chunks
+
+
+def _write_transcript(file_path: str, text):
+    """
+    Write a transcript to disk as UTF-8.
+    
+    The text is encoded once and written straight to the file descriptor in
+    SAVE_BUFFER_SIZE slices, skipping the text and buffered I/O layers.
+    
+    Args:
+        file_path: Destination file, created or truncated
+        text: Transcript text, or the transcript already encoded as UTF-8
+    """
+    data = memoryview(text.encode('utf-8') if isinstance(text, str) else text)
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = 0
+        while written < len(data):
+            written += os.write(fd, data[written:written + SAVE_BUFFER_SIZE])
+    finally:
+        os.close(fd)
+
+
+class _SaveTranscriptSignals(QObject):
+    """Signals for _SaveTranscriptTask"""
+    
+    finished = Signal(str, str)  # file_path, error message ('' on success)
+
+
+class _SaveTranscriptTask(QRunnable):
+    """Writes a transcript on a pool thread so slow drives don't block the dialog"""
+    
+    def __init__(self, file_path: str, text):
+        super().__init__()
+        self.file_path = file_path
+        self.text = text
+        self.signals = _SaveTranscriptSignals()
+    
+    def run(self):
+        error = ""
+        try:
+            _write_transcript(self.file_path, self.text)
+        except Exception as e:
+            error = str(e)
+        self.signals.finished.emit(self.file_path, error)
+
+
 class TranscriptionViewDialog(QDialog):
     """
     Dialog for viewing and managing transcription text.
@@ -34,44 +142,56 @@ class TranscriptionViewDialog(QDialog):
         self.memo = memo
         self.transcript_text = transcript_text
         
+        # Memo metadata, read once for the header and the save dialog
+        self._creation_date = getattr(memo, 'creation_date', None)
+        self._duration = getattr(memo, 'duration', None)
+        # Suggested save filename based on memo title, cleaned up
+        self._suggested_name = _UNSAFE_FILENAME_CHARS.sub('', f"{memo.title}.txt").rstrip()
+        
+        # Chunks of a long transcript still to be added to the text area
+        self._pending_chunks = []
+        self._chunk_timer = QTimer(self)
+        self._chunk_timer.setInterval(0)
+        self._chunk_timer.timeout.connect(self._append_next_chunk)
+        
+        # Save running on the thread pool, if any
+        self._save_task = None
+        
+        # UTF-8 encoding of the transcript, as bytes and as a QByteArray;
+        # made on the first copy and reused by later copies and saves
+        self._transcript_utf8 = None
+        self._transcript_qbytes = None
+        
+        # The header and the transcript are only filled in on first show
+        self._content_loaded = False
+        
         self.setWindowTitle(f"Transcription - {memo.title}")
         self.setMinimumSize(600, 400)
         self.resize(800, 600)
         
         self._setup_ui()
-        self._load_transcript()
+    
+    def showEvent(self, event):
+        """Build the header and load the transcript the first time the dialog is shown"""
+        if not self._content_loaded:
+            self._content_loaded = True
+            self._setup_header()
+            self._load_transcript()
+        super().showEvent(event)
     
     def _setup_ui(self):
-        """Set up the dialog UI"""
+        """Set up the dialog's text area and buttons"""
         layout = QVBoxLayout(self)
         
-        # Header with memo information in single line (no frame)
-        # Build information string: icon + filename - created date - duration
-        info_parts = [f"📝 {self.memo.title}"]
-        
-        if hasattr(self.memo, 'creation_date') and self.memo.creation_date:
-            date_str = self.memo.creation_date.strftime("%B %d, %Y at %H:%M")
-            info_parts.append(f"Created: {date_str}")
-        
-        if hasattr(self.memo, 'duration') and self.memo.duration:
-            minutes = int(self.memo.duration // 60)
-            seconds = int(self.memo.duration % 60)
-            info_parts.append(f"Duration: {minutes}:{seconds:02d}")
-        
-        # Create single line label
-        info_text = " - ".join(info_parts)
-        header_label = QLabel(info_text)
-        header_font = QFont()
-        header_font.setBold(True)
-        header_font.setPointSize(14)
-        header_label.setFont(header_font)
-        layout.addWidget(header_label)
-        
-        # Transcript text area
-        self.text_edit = QTextEdit()
+        # Transcript text area; plain text layout is much cheaper than rich
+        # text for long transcripts
+        self.text_edit = QPlainTextEdit()
         self.text_edit.setReadOnly(True)
-        self.text_edit.setFont(QFont("Arial", 14))  # Increased from 11 to 14
-        self.text_edit.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+        # A read-only view needs no undo history, which would otherwise keep
+        # another copy of the transcript
+        self.text_edit.setUndoRedoEnabled(False)
+        self.text_edit.setFont(_body_font())
+        self.text_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
         layout.addWidget(self.text_edit)
         
         # Action buttons
@@ -93,10 +213,60 @@ class TranscriptionViewDialog(QDialog):
         button_layout.addWidget(button_box)
         
         layout.addLayout(button_layout)
+        
+        # Transient confirmation shown over the dialog's bottom-right corner
+        self._toast = QLabel(self)
+        self._toast.setStyleSheet(
+            "QLabel { background-color: #222; color: white; padding: 4px 8px; border-radius: 4px; }"
+        )
+        self._toast.hide()
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.setInterval(TOAST_DURATION_MS)
+        self._toast_timer.timeout.connect(self._toast.hide)
+    
+    def _show_toast(self, text: str):
+        """Briefly show a confirmation without a modal message box"""
+        self._toast.setText(text)
+        self._toast.adjustSize()
+        self._toast.move(
+            self.width() - self._toast.width() - 12,
+            self.height() - self._toast.height() - 48
+        )
+        self._toast.raise_()
+        self._toast.show()
+        self._toast_timer.start()
+    
+    def _setup_header(self):
+        """Add the memo information header above the transcript"""
+        # Header with memo information in single line (no frame)
+        # Build information string: icon + filename - created date - duration
+        info_parts = [f"📝 {self.memo.title}"]
+        
+        if self._creation_date:
+            date_str = self._creation_date.strftime("%B %d, %Y at %H:%M")
+            info_parts.append(f"Created: {date_str}")
+        
+        if self._duration:
+            minutes = int(self._duration // 60)
+            seconds = int(self._duration % 60)
+            info_parts.append(f"Duration: {minutes}:{seconds:02d}")
+        
+        # Create single line label
+        info_text = " - ".join(info_parts)
+        header_label = QLabel(info_text)
+        header_label.setFont(_header_font())
+        self.layout().insertWidget(0, header_label)
     
     def _load_transcript(self):
         """Load the transcript text into the text editor"""
-        if self.transcript_text.strip():
+        if len(self.transcript_text) > CHUNKED_LOAD_THRESHOLD:
+            # Show the top right away; the rest follows between events
+            chunks = _split_into_chunks(self.transcript_text, LOAD_CHUNK_SIZE)
+            self.text_edit.setPlainText(chunks[0])
+            self._pending_chunks = chunks[:0:-1]  # reversed, popped from the end
+            self._chunk_timer.start()
+        elif self.transcript_text.strip():
             self.text_edit.setPlainText(self.transcript_text)
         else:
             self.text_edit.setPlainText("No transcript text available.")
@@ -108,19 +278,31 @@ class TranscriptionViewDialog(QDialog):
         cursor.movePosition(cursor.MoveOperation.Start)
         self.text_edit.setTextCursor(cursor)
     
+    def _append_next_chunk(self):
+        """Add the next pending transcript chunk to the text area"""
+        if not self._pending_chunks:
+            self._chunk_timer.stop()
+            return
+        self.text_edit.appendPlainText(self._pending_chunks.pop())
+        if not self._pending_chunks:
+            self._chunk_timer.stop()
+    
     def _copy_to_clipboard(self):
         """Copy transcript text to clipboard"""
         try:
             from PySide6.QtGui import QGuiApplication
-            clipboard = QGuiApplication.clipboard()
-            clipboard.setText(self.transcript_text)
+            # Hand the clipboard UTF-8 bytes rather than a QString; QMimeData
+            # decodes text/plain as UTF-8 on demand, and for mostly-ASCII
+            # transcripts this is half the size of the UTF-16 copy
+            mime_data = QMimeData()
+            if self._transcript_qbytes is None:
+                self._transcript_utf8 = self.transcript_text.encode('utf-8')
+                self._transcript_qbytes = QByteArray(self._transcript_utf8)
+            mime_data.setData("text/plain", self._transcript_qbytes)
+            QGuiApplication.clipboard().setMimeData(mime_data)
             
-            # Show confirmation
-            QMessageBox.information(
-                self,
-                "Copied",
-                "Transcript copied to clipboard!"
-            )
+            # Confirm without a modal box; copying is a repeated action
+            self._show_toast("Transcript copied to clipboard!")
             
         except Exception as e:
             QMessageBox.critical(
@@ -132,27 +314,22 @@ class TranscriptionViewDialog(QDialog):
     def _save_as(self):
         """Save transcript to a custom location"""
         try:
-            # Suggest filename based on memo title
-            suggested_name = f"{self.memo.title}.txt"
-            # Clean up filename
-            suggested_name = "".join(c for c in suggested_name if c.isalnum() or c in (' ', '-', '_', '.')).rstrip()
-            
             file_path, _ = QFileDialog.getSaveFileName(
                 self,
                 "Save Transcription",
-                suggested_name,
+                self._suggested_name,
                 "Text Files (*.txt);;All Files (*)"
             )
             
             if file_path:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.transcript_text)
-                
-                QMessageBox.information(
-                    self,
-                    "Saved",
-                    f"Transcription saved to:\n{file_path}"
-                )
+                # Written off the GUI thread; _on_save_finished reports back
+                self.save_button.setEnabled(False)
+                # Reuse the encoding from an earlier copy; otherwise the
+                # task encodes on the pool thread
+                transcript = self._transcript_utf8 if self._transcript_utf8 is not None else self.transcript_text
+                self._save_task = _SaveTranscriptTask(file_path, transcript)
+                self._save_task.signals.finished.connect(self._on_save_finished)
+                QThreadPool.globalInstance().start(self._save_task)
         
         except Exception as e:
             QMessageBox.critical(
@@ -160,3 +337,21 @@ class TranscriptionViewDialog(QDialog):
                 "Save Error",
                 f"Failed to save transcription: {e}"
             )
+    
+    def _on_save_finished(self, file_path: str, error: str):
+        """Report the outcome of a save started by _save_as"""
+        self._save_task = None
+        self.save_button.setEnabled(True)
+        
+        if error:
+            QMessageBox.critical(
+                self,
+                "Save Error",
+                f"Failed to save transcription: {error}"
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "Saved",
+                f"Transcription saved to:\n{file_path}"
+            )
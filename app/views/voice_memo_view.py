@@ -11,14 +11,14 @@ US3: Automatic Refresh & Filtering
 """
 
 import asyncio
-import re
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime, timedelta
 import logging
 import os
+import time
 
-from PySide6.QtCore import QTimer, QThread, Signal, QObject, Qt, QSortFilterProxyModel, QThreadPool
+from PySide6.QtCore import QTimer, QThread, Signal, Slot, QObject, Qt, QSortFilterProxyModel, QThreadPool
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableView, QPushButton, 
     QLabel, QProgressBar, QHeaderView, QMessageBox, QFrame,
@@ -41,7 +41,6 @@ from app.views.transcription_dialog import TranscriptionViewDialog
 from app.services.whisper_model_manager import WhisperModelManager
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -49,14 +48,57 @@ class VoiceMemoFilterProxyModel(QSortFilterProxyModel):
     """
     Proxy model for filtering Voice Memos based on search criteria.
     
-    This handles all the filtering logic efficiently without needing
-    to maintain separate filtered data structures.
+    This handles all the filtering logic efficiently; the only filter
+    state kept is the set of source rows matching the current search.
     """
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
         self.setFilterKeyColumn(-1)  # Search across all columns - ensures custom filterAcceptsRow is used
+        # Lowercased search text, set once per search change and read per row
+        self._needle = ""
+        # Source rows matching _needle, found in one pass over the source
+        # model's search texts; None until needed after a change
+        self._matching_rows = None
+    
+    def setSourceModel(self, source_model):
+        """Set the source model, forgetting matches whenever its rows change"""
+        super().setSourceModel(source_model)
+        self._matching_rows = None
+        for signal in (source_model.modelAboutToBeReset, source_model.layoutAboutToBeChanged,
+                       source_model.rowsAboutToBeInserted, source_model.rowsAboutToBeRemoved):
+            signal.connect(self._forget_matching_rows)
+    
+    def _forget_matching_rows(self, *args):
+        """Drop the matching rows; they are found again on the next filter pass"""
+        self._matching_rows = None
+    
+    def set_filter_text(self, text: str):
+        """
+        Filter rows to memos whose title, path or date contain text.
+        
+        Args:
+            text: Plain search text, matched case-insensitively as a substring
+        """
+        self._needle = text.lower()
+        self._matching_rows = None
+        self.invalidateRowsFilter()
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """
+        Sort by having the source model reorder its memos.
+        
+        The proxy itself is left unsorted so it follows the source order;
+        lessThan is only used if the source model cannot sort.
+        """
+        source_model = self.sourceModel()
+        if not hasattr(source_model, 'get_sort_key'):
+            super().sort(column, order)
+            return
+        
+        source_model.sort(column, order)
+        if self.sortColumn() != -1:
+            super().sort(-1, order)
     
     def lessThan(self, left, right):
         """
@@ -68,40 +110,20 @@ class VoiceMemoFilterProxyModel(QSortFilterProxyModel):
             if not source_model:
                 return False
             
-            # Get the actual memo objects for comparison
-            left_memo = source_model.get_memo_at_row(left.row())
-            right_memo = source_model.get_memo_at_row(right.row())
-            
-            if not left_memo or not right_memo:
-                return False
-            
+            # Date, duration, size and title compare precomputed keys:
+            # datetimes, numbers (missing values as 0) and lowercased titles
             column = left.column()
-            
-            # Handle date column with proper datetime comparison
-            if column == source_model.COL_DATE:
-                return left_memo.creation_date < right_memo.creation_date
-            
-            # Handle duration column with numeric comparison
-            elif column == source_model.COL_DURATION:
-                left_duration = left_memo.duration if left_memo.duration else 0
-                right_duration = right_memo.duration if right_memo.duration else 0
-                return left_duration < right_duration
-            
-            # Handle file size column with numeric comparison
-            elif column == source_model.COL_SIZE:
-                left_size = left_memo.file_size if left_memo.file_size else 0
-                right_size = right_memo.file_size if right_memo.file_size else 0
-                return left_size < right_size
-            
-            # Handle title column with case-insensitive string comparison
-            elif column == source_model.COL_TITLE:
-                return left_memo.get_display_title().lower() < right_memo.get_display_title().lower()
+            left_key = source_model.get_sort_key(left.row(), column)
+            if left_key is not None:
+                right_key = source_model.get_sort_key(right.row(), column)
+                if right_key is not None:
+                    return left_key < right_key
+                return False
             
             # For other columns, fall back to default string comparison
-            else:
-                left_data = source_model.data(left, Qt.ItemDataRole.DisplayRole)
-                right_data = source_model.data(right, Qt.ItemDataRole.DisplayRole)
-                return str(left_data).lower() < str(right_data).lower()
+            left_data = source_model.data(left, Qt.ItemDataRole.DisplayRole)
+            right_data = source_model.data(right, Qt.ItemDataRole.DisplayRole)
+            return str(left_data).lower() < str(right_data).lower()
                 
         except Exception as e:
             logger.warning(f"Error in lessThan sorting: {e}")
@@ -113,32 +135,19 @@ class VoiceMemoFilterProxyModel(QSortFilterProxyModel):
         Custom filtering logic for Voice Memos.
         This method is called for every row when filtering is applied.
         """
+        needle = self._needle
+        if not needle:
+            return True  # No filter, show all rows
+        
         try:
             source_model = self.sourceModel()
             if not source_model:
                 return True
             
-            # Get the current filter regular expression
-            filter_regex = self.filterRegularExpression()
-            if not filter_regex.pattern():
-                return True  # No filter, show all rows
-            
-            # Get the memo for this row
-            memo = source_model.get_memo_at_row(source_row)
-            if not memo:
-                return False
-            
-            # Search in title, file path, and date
-            search_fields = [
-                memo.get_display_title().lower(),
-                str(memo.file_path).lower() if memo.file_path else "",  # Convert PosixPath to string
-                memo.creation_date.strftime("%Y-%m-%d %H:%M").lower(),
-                memo.creation_date.strftime("%d-%b-%y").lower(),  # Also search in formatted date
-            ]
-            
-            # Apply the filter - check if any field matches
-            pattern_lower = filter_regex.pattern().lower()
-            return any(pattern_lower in field for field in search_fields if field)
+            # Match every row in one pass, then answer each row by lookup
+            if self._matching_rows is None:
+                self._matching_rows = source_model.find_rows_containing(needle)
+            return source_row in self._matching_rows
             
         except Exception as e:
             # Log error but don't crash - show the row in case of error
@@ -158,11 +167,30 @@ class VoiceMemoFileWatcher(QObject):
     file_changed = Signal(str)  # File path that changed
     refresh_needed = Signal()   # General refresh needed
     
+    # Raised from the watchdog observer thread, delivered queued on ours
+    _db_event = Signal()
+    _audio_event = Signal(str)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.observer = None  # Observer instance
         self.watch_path = None  # Currently watched path
         self._event_handler = VoiceMemoEventHandler(self)
+        
+        # Debounce timer to avoid too frequent refreshes
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self._emit_refresh)
+        self._debounce_ms = 1000
+        # Flush at least this often even while events keep arriving
+        self._max_wait_ms = 3000
+        self._first_event_time = None
+        self._db_changed = False
+        self._changed_audio_paths = set()
+        
+        # Batch state and the timer are only touched on this object's thread
+        self._db_event.connect(self._on_db_event, Qt.ConnectionType.QueuedConnection)
+        self._audio_event.connect(self._on_audio_event, Qt.ConnectionType.QueuedConnection)
     
     def start_watching(self, db_path: str):
         """Start monitoring the Voice Memos directory"""
@@ -208,18 +236,59 @@ class VoiceMemoFileWatcher(QObject):
     def is_watching(self) -> bool:
         """Check if currently watching a directory"""
         return self.observer is not None and self.observer.is_alive()
+    
+    @Slot()
+    def _on_db_event(self):
+        """Batch a database change into the pending refresh"""
+        self._db_changed = True
+        self._schedule_refresh()
+    
+    @Slot(str)
+    def _on_audio_event(self, file_path: str):
+        """Batch an audio file change into the pending refresh"""
+        self._changed_audio_paths.add(file_path)
+        self._schedule_refresh()
+    
+    def _schedule_refresh(self):
+        """Schedule a refresh with debouncing, bounded by the max wait"""
+        now = time.monotonic()
+        if self._first_event_time is None:
+            self._first_event_time = now
+        
+        # Restart timer to debounce multiple rapid changes, but never past
+        # the max wait so a steady burst (e.g. iCloud sync) still flushes
+        elapsed_ms = (now - self._first_event_time) * 1000
+        delay_ms = min(self._debounce_ms, max(0, int(self._max_wait_ms - elapsed_ms)))
+        self.refresh_timer.stop()
+        self.refresh_timer.start(delay_ms)
+        
+    def _emit_refresh(self):
+        """Emit the pending refresh signals and reset the batch"""
+        db_changed = self._db_changed
+        audio_paths = self._changed_audio_paths
+        self._first_event_time = None
+        self._db_changed = False
+        self._changed_audio_paths = set()
+        
+        for file_path in sorted(audio_paths):
+            self.file_changed.emit(file_path)
+        # One reload per batch; a new recording's audio can land before or
+        # without a database write, so audio batches reload too
+        if db_changed or audio_paths:
+            self.refresh_needed.emit()
 
 
 class VoiceMemoEventHandler(FileSystemEventHandler):
-    """Event handler for file system changes in Voice Memos directory"""
+    """
+    Event handler for file system changes in Voice Memos directory.
+    
+    Runs on the watchdog observer thread, so it only classifies events and
+    hands them to the watcher through queued signals.
+    """
     
     def __init__(self, watcher: VoiceMemoFileWatcher):
         super().__init__()
         self.watcher = watcher
-        # Debounce timer to avoid too frequent refreshes
-        self.refresh_timer = QTimer()
-        self.refresh_timer.setSingleShot(True)
-        self.refresh_timer.timeout.connect(self._emit_refresh)
         
     def on_modified(self, event):
         """Handle file modification events"""
@@ -231,7 +300,7 @@ class VoiceMemoEventHandler(FileSystemEventHandler):
         # Check if this is the CloudRecordings.db file
         if Path(file_path).name == "CloudRecordings.db":
             logger.debug(f"📝 Voice Memos database modified: {file_path}")
-            self._schedule_refresh()
+            self.watcher._db_event.emit()
     
     def on_created(self, event):
         """Handle file creation events"""
@@ -241,19 +310,48 @@ class VoiceMemoEventHandler(FileSystemEventHandler):
         file_path = event.src_path
         
         # Check for new voice memo files or database changes
-        if file_path.endswith(('.m4a', '.wav', '.mp3')) or Path(file_path).name == "CloudRecordings.db":
+        if Path(file_path).name == "CloudRecordings.db":
+            logger.debug(f"📄 New database file detected: {file_path}")
+            self.watcher._db_event.emit()
+        elif file_path.endswith(('.m4a', '.wav', '.mp3')):
             logger.debug(f"📄 New file detected: {file_path}")
-            self._schedule_refresh()
+            self.watcher._audio_event.emit(file_path)
+
+
+# Where finished transcriptions are saved, one <memo uuid>.txt per memo
+TRANSCRIPTION_DIR = Path.home() / "Library" / "Application Support" / "AudioTransLocal" / "transcriptions"
+
+# Quiet time after the last search keystroke before the list is filtered
+SEARCH_DEBOUNCE_MS = 150
+
+
+def _mark_existing_transcriptions(memos: List[VoiceMemoModel]) -> int:
+    """
+    Mark memos that already have a transcription file as transcribed.
     
-    def _schedule_refresh(self):
-        """Schedule a refresh with debouncing"""
-        # Restart timer to debounce multiple rapid changes
-        self.refresh_timer.stop()
-        self.refresh_timer.start(1000)  # 1 second delay
+    Lists the transcription directory once instead of stat-ing a file per
+    memo, so it stays cheap for libraries with thousands of memos.
+    
+    Args:
+        memos: Memos to update in place
         
-    def _emit_refresh(self):
-        """Emit the refresh signal"""
-        self.watcher.refresh_needed.emit()
+    Returns:
+        Number of memos marked as transcribed
+    """
+    try:
+        with os.scandir(TRANSCRIPTION_DIR) as entries:
+            existing = {entry.name for entry in entries}
+    except OSError:
+        return 0
+    
+    transcribed_count = 0
+    for memo in memos:
+        filename = f"{memo.uuid}.txt"
+        if filename in existing:
+            memo.transcription_status = "transcribed"
+            memo.transcription_file_path = TRANSCRIPTION_DIR / filename
+            transcribed_count += 1
+    return transcribed_count
 
 
 class VoiceMemoLoader(QObject):
@@ -299,6 +397,7 @@ class VoiceMemoLoader(QObject):
             try:
                 self.loading_progress.emit("Fetching Voice Memo records...")
                 memos = loop.run_until_complete(parser.load_voice_memos())
+                _mark_existing_transcriptions(memos)
                 
                 self.loading_progress.emit(f"Loaded {len(memos)} Voice Memos successfully")
                 self.loading_finished.emit(memos)
@@ -412,8 +511,7 @@ class VoiceMemoDetailPanel(QWidget):
         """Load existing transcription text if available"""
         try:
             # Check if transcription file exists based on memo UUID
-            transcription_dir = Path.home() / "Library" / "Application Support" / "AudioTransLocal" / "transcriptions"
-            transcription_file = transcription_dir / f"{memo.uuid}.txt"
+            transcription_file = TRANSCRIPTION_DIR / f"{memo.uuid}.txt"
             
             if transcription_file.exists():
                 with open(transcription_file, 'r', encoding='utf-8') as f:
@@ -512,12 +610,21 @@ class VoiceMemoView(QWidget):
         
         # Set up default sorting: newest on top (descending by date)
         self.proxy_model.setSortCaseSensitivity(Qt.CaseInsensitive)
+        # Re-filters rows when their data changes; re-sorting on data changes
+        # is done by the table model, which owns the sort order
         self.proxy_model.setDynamicSortFilter(True)
         
         # Initialize file watcher
         self.file_watcher = VoiceMemoFileWatcher(self)
         self.file_watcher.refresh_needed.connect(self._on_auto_refresh)
         
+        # Coalesces search keystrokes into one filter pass per typing burst
+        self._pending_search = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_search)
+        
         # Track current database path for refresh and monitoring
         self.current_db_path = None
         
@@ -688,22 +795,27 @@ class VoiceMemoView(QWidget):
         self.search_field.textChanged.connect(self._on_search_changed)
     
     def _on_search_changed(self, text: str):
+        """Filter once typing pauses; clearing the search applies at once"""
+        self._pending_search = text
+        
+        # Show/hide clear button based on whether there's text
+        self.clear_search_btn.setEnabled(bool(text.strip()))
+        
+        if text.strip():
+            self._search_timer.start()
+        else:
+            self._search_timer.stop()
+            self._apply_search()
+    
+    def _apply_search(self):
         """
-        Handle search field changes with robust, professional filtering.
-        Uses regex escaping to prevent crashes from special characters.
+        Apply the pending search text with robust, professional filtering.
+        The text is matched as a plain substring, so special characters
+        such as '(' or '*' need no escaping.
         """
+        text = self._pending_search
         try:
-            # Import regex module for safe escaping
-            import re
-            
-            # 1. Escape special characters to prevent regex errors (e.g., from '(' or '*')
-            safe_text = re.escape(text.strip()) if text.strip() else ""
-            
-            # 2. Set the escaped text as a regular expression on our custom proxy model
-            self.proxy_model.setFilterRegularExpression(safe_text)
-            
-            # Show/hide clear button based on whether there's text
-            self.clear_search_btn.setEnabled(bool(text.strip()))
+            self.proxy_model.set_filter_text(text.strip())
             
             # Update status label with search results
             if text.strip():
@@ -717,7 +829,7 @@ class VoiceMemoView(QWidget):
         except Exception as e:
             logger.error(f"Error in search handling: {e}")
             # Fallback to showing all items if search fails
-            self.proxy_model.setFilterRegularExpression("")
+            self.proxy_model.set_filter_text("")
             self.status_label.setText("⚠️ Search error - showing all Voice Memos")
     
     def _clear_search(self):
@@ -797,11 +909,10 @@ class VoiceMemoView(QWidget):
     
     def _on_loading_finished(self, memos: List[VoiceMemoModel]):
         """Handle loading completion"""
+        # The table model keeps the header's sort (newest first by default)
+        # across reloads, so the rows arrive already in display order
         self.table_model.set_memos(memos)
         
-        # Apply default sorting (newest first) - do this after setting data
-        QTimer.singleShot(100, lambda: self.table_view.sortByColumn(VoiceMemoTableModel.COL_DATE, Qt.DescendingOrder))
-        
         self.progress_bar.setVisible(False)
         self.refresh_button.setEnabled(True)
         
@@ -844,11 +955,6 @@ class VoiceMemoView(QWidget):
         if self.current_db_path and Path(self.current_db_path).exists() and len(memos) > 0:
             self.file_watcher.start_watching(self.current_db_path)
         
-        # Sort by date column (newest first) after loading data  
-        if len(memos) > 0:
-            date_column = VoiceMemoTableModel.COL_DATE
-            self.table_view.sortByColumn(date_column, Qt.DescendingOrder)
-        
         # Clean up thread
         if self._loader_thread:
             self._loader_thread.quit()
@@ -862,22 +968,12 @@ class VoiceMemoView(QWidget):
         logger.info(f"✅ Successfully loaded {len(memos)} Voice Memos")
     
     def _check_existing_transcriptions(self, memos: List[VoiceMemoModel]):
-        """Check for existing transcription files and update memo statuses"""
-        transcription_dir = Path.home() / "Library" / "Application Support" / "AudioTransLocal" / "transcriptions"
-        
-        if not transcription_dir.exists():
-            return
-        
+        """Update memo statuses for the transcriptions found by the loader"""
+        # The transcription files were already matched on the loader thread
+        # by _mark_existing_transcriptions; only the state manager is updated here
         transcribed_count = 0
         for memo in memos:
-            transcription_file = transcription_dir / f"{memo.uuid}.txt"
-            if transcription_file.exists():
-                # Update memo status
-                memo.transcription_status = "transcribed"
-                memo.transcription_file_path = transcription_file
-                
-                # Update state manager
-                from app.services.voice_memo_model import VoiceMemoStatus
+            if memo.transcription_status == "transcribed":
                 self.state_manager.set_status(memo.uuid, VoiceMemoStatus.TRANSCRIBED)
                 transcribed_count += 1
         
@@ -1130,8 +1226,7 @@ class VoiceMemoView(QWidget):
                 transcription_file = memo.transcription_file_path
             else:
                 # Fallback: construct path from memo UUID
-                transcription_dir = Path.home() / "Library" / "Application Support" / "AudioTransLocal" / "transcriptions"
-                transcription_file = transcription_dir / f"{memo.uuid}.txt"
+                transcription_file = TRANSCRIPTION_DIR / f"{memo.uuid}.txt"
             
             if not transcription_file.exists():
                 QMessageBox.warning(
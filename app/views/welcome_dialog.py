@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                             QPushButton, QTextEdit, QFileDialog, QMessageBox,
                             QApplication)
 from PySide6.QtCore import Qt
-from resources.styles import apply_style, get_font
+from resources.styles import apply_styles, get_font
 from app.services.validation import SettingsValidator
 
 
@@ -34,7 +34,7 @@ class WelcomeDialog(QDialog):
         title = QLabel("Welcome to AudioTransLocal")
         title.setAlignment(Qt.AlignCenter)
         title.setFont(get_font('title_medium'))
-        apply_style(title, 'welcome_title')
+        styled_widgets = [(title, 'welcome_title')]
         
         # Welcome message
         message = QTextEdit()
@@ -60,12 +60,12 @@ class WelcomeDialog(QDialog):
         
         # Quit button
         quit_btn = QPushButton("Quit")
-        apply_style(quit_btn, 'button_danger')
+        styled_widgets.append((quit_btn, 'button_danger'))
         quit_btn.clicked.connect(self.quit_application)
         
         # Select folder button
         select_btn = QPushButton("Select Folder...")
-        apply_style(select_btn, 'button_primary')
+        styled_widgets.append((select_btn, 'button_primary'))
         select_btn.clicked.connect(self.select_folder)
         select_btn.setDefault(True)  # Make this the default button
         
@@ -81,6 +81,9 @@ class WelcomeDialog(QDialog):
         
         self.setLayout(layout)
         
+        # One stylesheet for the whole dialog instead of one per widget
+        apply_styles(self, styled_widgets)
+        
     def select_folder(self):
         """Handle folder selection with validation"""
         # Get suggested default path (Voice Memos location)
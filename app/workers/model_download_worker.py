@@ -7,18 +7,32 @@ Whisper model files. It follows the proper Qt threading pattern with QRunnable
 and provides real-time progress updates.
 """
 
-import hashlib
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Optional
 
 import httpx
 from PySide6.QtCore import QObject, QRunnable, Signal
 
+from app.services.whisper_model_manager import sha256_file
+
 logger = logging.getLogger(__name__)
 
+# Read size for streamed response bodies
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Files at least this large are fetched as parallel Range requests when the
+# server supports them
+MIN_PARALLEL_DOWNLOAD_SIZE = 32 * 1024 * 1024
+PARALLEL_DOWNLOAD_SEGMENTS = 8
+
+# Attempts per segment before the download fails
+SEGMENT_RETRIES = 3
+
 
 class ModelDownloadSignals(QObject):
     """Signals for model download worker with structured data"""
@@ -59,9 +73,14 @@ class ModelDownloadWorker(QRunnable):
         self.model_id = model_id
         self.download_url = download_url
         self.destination_path = Path(destination_path)
+        # Written here and renamed into place once complete and verified, so
+        # a partial file is never mistaken for a downloaded model
+        self.part_path = self.destination_path.with_suffix('.part')
         self.expected_sha256 = expected_sha256
         self.signals = ModelDownloadSignals()
         self._cancelled = False
+        # Last percentage sent to the UI, to skip redundant progress signals
+        self._last_percentage = -1
         
         # Ensure destination directory exists
         self.destination_path.parent.mkdir(parents=True, exist_ok=True)
@@ -87,91 +106,64 @@ class ModelDownloadWorker(QRunnable):
             self.signals.status_updated.emit(self.model_id, "Connecting...")
             
             download_start_time = time.time()
-            last_progress_time = download_start_time
             
-            # Use httpx for streaming download with progress tracking
-            with httpx.stream("GET", self.download_url, follow_redirects=True) as response:
-                if response.status_code != 200:
-                    raise Exception(f"HTTP {response.status_code}: {response.reason_phrase}")
+            with httpx.Client(follow_redirects=True) as client:
+                # Resolve redirects and learn the size up front
+                head = client.head(self.download_url)
+                total_size = 0
+                supports_ranges = False
+                if head.status_code == 200:
+                    total_size = int(head.headers.get("content-length", 0))
+                    supports_ranges = head.headers.get("accept-ranges", "").lower() == "bytes"
                 
-                # Get total file size from headers
-                total_size = int(response.headers.get("content-length", 0))
+                self.signals.status_updated.emit(self.model_id, "Downloading...")
                 
-                if total_size == 0:
-                    logger.warning(f"⚠️ Content-Length header missing for {self.model_id}")
-                
-                downloaded_size = 0
-                
-                # Open destination file for writing
-                with open(self.destination_path, "wb") as f:
-                    self.signals.status_updated.emit(self.model_id, "Downloading...")
-                    
-                    # Download in chunks
-                    for chunk in response.iter_bytes(chunk_size=64 * 1024):  # 64KB chunks
-                        if self._cancelled:
-                            # Clean up partial file
-                            f.close()
-                            if self.destination_path.exists():
-                                self.destination_path.unlink()
-                            self.signals.download_cancelled.emit(self.model_id)
-                            return
-                        
-                        f.write(chunk)
-                        downloaded_size += len(chunk)
-                        
-                        # Calculate progress and speed
-                        current_time = time.time()
-                        if current_time - last_progress_time >= 0.1:  # Update every 100ms
-                            elapsed_time = current_time - download_start_time
-                            speed_bps = downloaded_size / elapsed_time if elapsed_time > 0 else 0
-                            
-                            if total_size > 0:
-                                percentage = int((downloaded_size / total_size) * 100)
-                            else:
-                                percentage = 0
-                            
-                            # Emit structured progress data
-                            progress_data = {
-                                'model_id': self.model_id,
-                                'percentage': percentage,
-                                'downloaded_bytes': downloaded_size,
-                                'total_bytes': total_size,
-                                'speed_bps': speed_bps,
-                                'elapsed_seconds': elapsed_time
-                            }
-                            self.signals.progress_updated.emit(progress_data)
-                            last_progress_time = current_time
-                
-                self.signals.status_updated.emit(self.model_id, "Download complete, verifying...")
-                
-                # Verify file integrity if SHA256 is provided
-                if self.expected_sha256:
-                    if self._verify_sha256():
-                        self.signals.status_updated.emit(self.model_id, "Verification successful")
-                        self.signals.download_completed.emit(
-                            self.model_id, True, 
-                            f"Successfully downloaded and verified {self.destination_path.name}"
-                        )
-                    else:
-                        # Remove corrupted file
-                        if self.destination_path.exists():
-                            self.destination_path.unlink()
-                        self.signals.download_completed.emit(
-                            self.model_id, False, 
-                            "Download failed: File integrity check failed"
-                        )
+                if supports_ranges and total_size >= MIN_PARALLEL_DOWNLOAD_SIZE:
+                    completed = self._download_ranges(
+                        client, str(head.url), total_size, download_start_time
+                    )
                 else:
-                    # No verification, just confirm download
+                    completed = self._download_stream(client, download_start_time)
+            
+            if not completed:
+                # Clean up partial file
+                if self.part_path.exists():
+                    self.part_path.unlink()
+                self.signals.download_cancelled.emit(self.model_id)
+                return
+            
+            self.signals.status_updated.emit(self.model_id, "Download complete, verifying...")
+            
+            # Verify file integrity if SHA256 is provided
+            if self.expected_sha256:
+                if self._verify_sha256():
+                    os.replace(self.part_path, self.destination_path)
+                    self.signals.status_updated.emit(self.model_id, "Verification successful")
                     self.signals.download_completed.emit(
                         self.model_id, True, 
-                        f"Successfully downloaded {self.destination_path.name}"
+                        f"Successfully downloaded and verified {self.destination_path.name}"
                     )
+                else:
+                    # Remove corrupted file
+                    if self.part_path.exists():
+                        self.part_path.unlink()
+                    self.signals.download_completed.emit(
+                        self.model_id, False, 
+                        "Download failed: File integrity check failed"
+                    )
+            else:
+                # No verification, just confirm download
+                os.replace(self.part_path, self.destination_path)
+                self.signals.download_completed.emit(
+                    self.model_id, True, 
+                    f"Successfully downloaded {self.destination_path.name}"
+                )
                 
         except Exception as e:
             # Clean up partial file on error
-            if self.destination_path.exists():
+            if self.part_path.exists():
                 try:
-                    self.destination_path.unlink()
+                    self.part_path.unlink()
                 except:
                     pass
             
@@ -179,6 +171,161 @@ class ModelDownloadWorker(QRunnable):
             logger.error(f"❌ {error_msg}")
             self.signals.download_completed.emit(self.model_id, False, error_msg)
     
+    def _download_stream(self, client: httpx.Client, download_start_time: float) -> bool:
+        """
+        Download the file as a single streamed GET.
+        
+        Args:
+            client: HTTP client to use
+            download_start_time: time.time() when the download started
+            
+        Returns:
+            True if the download finished, False if it was cancelled
+        """
+        last_progress_time = download_start_time
+        
+        with client.stream("GET", self.download_url) as response:
+            if response.status_code != 200:
+                raise Exception(f"HTTP {response.status_code}: {response.reason_phrase}")
+            
+            # Get total file size from headers
+            total_size = int(response.headers.get("content-length", 0))
+            
+            if total_size == 0:
+                logger.warning(f"⚠️ Content-Length header missing for {self.model_id}")
+            
+            downloaded_size = 0
+            
+            # Open the partial file for writing
+            with open(self.part_path, "wb") as f:
+                # Download in chunks
+                for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if self._cancelled:
+                        return False
+                    
+                    f.write(chunk)
+                    downloaded_size += len(chunk)
+                    
+                    current_time = time.time()
+                    if current_time - last_progress_time >= 0.1:  # Update every 100ms
+                        self._emit_progress(downloaded_size, total_size, download_start_time)
+                        last_progress_time = current_time
+        
+        return True
+    
+    def _download_ranges(self, client: httpx.Client, url: str, total_size: int,
+                         download_start_time: float) -> bool:
+        """
+        Download the file as parallel HTTP Range requests into a preallocated file.
+        
+        Each segment is fetched on its own thread and written at its offset.
+        A segment that fails mid-transfer is retried from the last byte it
+        wrote rather than from the start. Once a segment gives up, the others
+        stop at their next chunk instead of finishing their ranges.
+        
+        Args:
+            client: HTTP client to use (shared across segment threads)
+            url: Final download URL, after redirects
+            total_size: Size of the file in bytes
+            download_start_time: time.time() when the download started
+            
+        Returns:
+            True if the download finished, False if it was cancelled
+        """
+        # Preallocate the partial file so every segment can write in place
+        with open(self.part_path, "wb") as f:
+            f.truncate(total_size)
+        
+        segment_size = -(-total_size // PARALLEL_DOWNLOAD_SEGMENTS)  # ceil division
+        segments = [
+            (start, min(start + segment_size, total_size) - 1)
+            for start in range(0, total_size, segment_size)
+        ]
+        
+        progress_lock = threading.Lock()
+        downloaded = [0]
+        # Set when any segment fails, so the rest stop early
+        failed = threading.Event()
+        
+        def fetch_segment(start: int, end: int):
+            try:
+                _fetch_segment(start, end)
+            except Exception:
+                failed.set()
+                raise
+        
+        def _fetch_segment(start: int, end: int):
+            position = start
+            for attempt in range(1, SEGMENT_RETRIES + 1):
+                try:
+                    headers = {"Range": f"bytes={position}-{end}"}
+                    with client.stream("GET", url, headers=headers) as response:
+                        if response.status_code != 206:
+                            raise Exception(f"HTTP {response.status_code}: {response.reason_phrase}")
+                        
+                        with open(self.part_path, "r+b") as f:
+                            f.seek(position)
+                            for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                                if self._cancelled or failed.is_set():
+                                    return
+                                f.write(chunk)
+                                position += len(chunk)
+                                with progress_lock:
+                                    downloaded[0] += len(chunk)
+                    
+                    if position > end:
+                        return
+                    raise httpx.ReadError(f"Segment ended early at byte {position}")
+                    
+                except httpx.TransportError as e:
+                    if attempt == SEGMENT_RETRIES or failed.is_set():
+                        raise
+                    logger.warning(f"⚠️ Retrying bytes {position}-{end} of {self.model_id}: {e}")
+        
+        with ThreadPoolExecutor(max_workers=len(segments)) as pool:
+            futures = [pool.submit(fetch_segment, start, end) for start, end in segments]
+            
+            pending = futures
+            while pending:
+                _, pending = wait(pending, timeout=0.1)  # Update every 100ms
+                self._emit_progress(downloaded[0], total_size, download_start_time)
+            
+            # Surface the first segment failure, if any
+            for future in futures:
+                future.result()
+        
+        return not self._cancelled
+    
+    def _emit_progress(self, downloaded_size: int, total_size: int, download_start_time: float):
+        """
+        Emit structured progress data for the current download state.
+        
+        Callers already limit this to one call per 100ms; the signal is
+        additionally skipped while the whole-number percentage is unchanged,
+        since each emission is a queued cross-thread event for the GUI.
+        """
+        if total_size > 0:
+            percentage = int((downloaded_size / total_size) * 100)
+        else:
+            percentage = 0
+        
+        if percentage == self._last_percentage:
+            return
+        self._last_percentage = percentage
+        
+        elapsed_time = time.time() - download_start_time
+        speed_bps = downloaded_size / elapsed_time if elapsed_time > 0 else 0
+        
+        progress_data = {
+            'model_id': self.model_id,
+            'percentage': percentage,
+            'downloaded_bytes': downloaded_size,
+            'total_bytes': total_size,
+            'speed_bps': speed_bps,
+            'elapsed_seconds': elapsed_time
+        }
+        self.signals.progress_updated.emit(progress_data)
+    
     def _verify_sha256(self) -> bool:
         """Verify the downloaded file's SHA256 checksum"""
         if not self.expected_sha256:
@@ -187,12 +334,7 @@ class ModelDownloadWorker(QRunnable):
         try:
             self.signals.status_updated.emit(self.model_id, "Verifying file integrity...")
             
-            sha256_hash = hashlib.sha256()
-            
-            with open(self.destination_path, "rb") as f:
-                # Read file in chunks to handle large files efficiently
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
+            sha256_hash = sha256_file(self.part_path)
             
             calculated_sha256 = sha256_hash.hexdigest()
             
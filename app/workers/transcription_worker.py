@@ -18,7 +18,6 @@ from PySide6.QtCore import QObject, QRunnable, Signal
 import ffmpeg
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -11,7 +11,6 @@ from PySide6.QtCore import QSettings
 
 from app.core.service_factory import ServiceContainer, create_container
 from app.views.main_window import MainWindow
-from app.views.preferences_window import PreferencesWindow
 from app.views.welcome_dialog import WelcomeDialog
 from app.services.credentials_manager import CredentialsManager
 from app.services.macos_bookmarks import BookmarkAwareSettings
@@ -30,6 +29,8 @@ class AudioTransLocalApp:
         self.app = QApplication(sys.argv)
         self.settings = QSettings("AudioTransLocal", "AudioTransLocal")
         self.bookmark_settings = BookmarkAwareSettings(self.settings)
+        # Bookmarks stay resolved for the session; release them on quit
+        self.app.aboutToQuit.connect(self.bookmark_settings.release_all)
         
         # Use the new ServiceContainer instead of ServiceFactory
         self.container = create_container()
@@ -113,6 +114,8 @@ class AudioTransLocalApp:
 
 def main():
     """Main entry point of the application"""
+    # Logging is configured here, once, rather than by each module on import
+    logging.basicConfig(level=logging.INFO)
     app_controller = AudioTransLocalApp()
     return app_controller.run()
 
@@ -4,6 +4,9 @@ AudioTransLocal - Native macOS styling system
 This module provides native macOS appearance for maximum visual fidelity and user confidence.
 """
 
+import functools
+import re
+
 # Native macOS styling approach - minimal custom styling to preserve native look
 NATIVE_STYLES = {
     # Only override essential spacing and layout, preserve native macOS appearance
@@ -113,6 +116,31 @@ NATIVE_STYLES = {
     """,
 }
 
+# Map old style names to native equivalents
+STYLE_ALIASES = {
+    'button_primary': 'native_button',
+    'button_success': 'native_button', 
+    'button_danger': 'native_button',
+    'button_secondary': 'native_button',
+    'button_info': 'native_button',
+    'input_readonly': 'native_readonly_input',
+    'input_password': 'native_input',
+    'dropdown': 'native_dropdown',
+    'progress_bar': 'native_progress',
+    'welcome_title': 'welcome_title',
+    'help_text': 'help_text',
+    'status_success': 'status_success',
+    'instructions': 'instructions',
+    'folder_info': 'folder_info',
+    'status_label': 'status_label',
+}
+
+# Dynamic property that ties a widget to its rules in a scoped stylesheet
+STYLE_CLASS_PROPERTY = "styleClass"
+
+# Type selector (with optional attribute selectors) at the start of a rule
+_SELECTOR_PATTERN = re.compile(r'(^|\})(\s*)([A-Za-z]\w*)')
+
 def apply_native_style(widget, style_name):
     """Apply minimal native-friendly styling to preserve macOS appearance"""
     style = NATIVE_STYLES.get(style_name, '')
@@ -122,28 +150,49 @@ def apply_native_style(widget, style_name):
 # Convenience function for backward compatibility
 def apply_style(widget, style_name):
     """Apply native styling (backward compatibility wrapper)"""
-    # Map old style names to native equivalents
-    style_mapping = {
-        'button_primary': 'native_button',
-        'button_success': 'native_button', 
-        'button_danger': 'native_button',
-        'button_secondary': 'native_button',
-        'button_info': 'native_button',
-        'input_readonly': 'native_readonly_input',
-        'input_password': 'native_input',
-        'dropdown': 'native_dropdown',
-        'progress_bar': 'native_progress',
-        'welcome_title': 'welcome_title',
-        'help_text': 'help_text',
-        'status_success': 'status_success',
-        'instructions': 'instructions',
-        'folder_info': 'folder_info',
-        'status_label': 'status_label',
-    }
-    
-    native_style = style_mapping.get(style_name, style_name)
+    native_style = STYLE_ALIASES.get(style_name, style_name)
     apply_native_style(widget, native_style)
 
+@functools.lru_cache(maxsize=None)
+def scoped_stylesheet(style_names):
+    """
+    Build one stylesheet covering several native styles.
+    
+    Each rule is narrowed to widgets whose styleClass property names its
+    style, e.g. QLabel[styleClass="help_text"], so the sheet can be set
+    on a top-level window without affecting other children.
+    
+    Args:
+        style_names: Tuple of native style names
+        
+    Returns:
+        Combined stylesheet text
+    """
+    parts = []
+    for style_name in style_names:
+        style = NATIVE_STYLES.get(style_name, '')
+        scope = f'[{STYLE_CLASS_PROPERTY}="{style_name}"]'
+        parts.append(_SELECTOR_PATTERN.sub(lambda m: f"{m.group(1)}{m.group(2)}{m.group(3)}{scope}", style))
+    return "".join(parts)
+
+def apply_styles(container, styled_widgets):
+    """
+    Style many widgets with a single stylesheet on their container.
+    
+    Equivalent to calling apply_style for each widget, but Qt computes the
+    style once for the container instead of once per setStyleSheet call.
+    
+    Args:
+        container: Top-level widget that owns the styled widgets
+        styled_widgets: Iterable of (widget, style_name) pairs
+    """
+    style_names = set()
+    for widget, style_name in styled_widgets:
+        native_style = STYLE_ALIASES.get(style_name, style_name)
+        widget.setProperty(STYLE_CLASS_PROPERTY, native_style)
+        style_names.add(native_style)
+    container.setStyleSheet(scoped_stylesheet(tuple(sorted(style_names))))
+
 def get_native_font(font_type='body'):
     """Get native macOS system fonts"""
     from PySide6.QtGui import QFont
@@ -129,7 +129,7 @@ async def test_database_exploration():
         db_path = temp_path / "CloudRecordings.db"
         create_test_voice_memos_db(db_path)
         
-        from voice_memo_parser import VoiceMemoDatabase
+        from voice_memo_parser import VoiceMemoDatabase, _RECORD_FIELDS
         
         db = VoiceMemoDatabase(db_path)
         
@@ -151,7 +151,7 @@ async def test_database_exploration():
                 if raw_records:
                     print("📝 Sample record:")
                     sample = raw_records[0]
-                    for key, value in sample.items():
+                    for key, value in zip(_RECORD_FIELDS, sample):
                         print(f"   {key}: {value}")
                 
             else:
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the scoped stylesheets built from the native styles
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from resources.styles import NATIVE_STYLES, STYLE_CLASS_PROPERTY, scoped_stylesheet
+
+
+class TestScopedStylesheet(unittest.TestCase):
+    """Test scoped_stylesheet output"""
+
+    def test_rules_are_scoped_to_style_class(self):
+        """Test that each type selector gains the styleClass attribute"""
+        sheet = scoped_stylesheet(("native_button",))
+        self.assertIn(f'QPushButton[{STYLE_CLASS_PROPERTY}="native_button"] {{', sheet)
+        self.assertIn("min-height: 28px;", sheet)
+        self.assertNotIn("QPushButton {", sheet)
+
+    def test_existing_attribute_selectors_are_kept(self):
+        """Test that a rule with its own attribute selector keeps it"""
+        sheet = scoped_stylesheet(("native_readonly_input",))
+        self.assertIn(f'QLineEdit[{STYLE_CLASS_PROPERTY}="native_readonly_input"] {{', sheet)
+        self.assertIn(
+            f'QLineEdit[{STYLE_CLASS_PROPERTY}="native_readonly_input"][readOnly="true"] {{',
+            sheet
+        )
+
+    def test_several_styles_combined(self):
+        """Test that every requested style appears once, in order"""
+        sheet = scoped_stylesheet(("help_text", "native_input"))
+        help_rule = f'QLabel[{STYLE_CLASS_PROPERTY}="help_text"]'
+        input_rule = f'QLineEdit[{STYLE_CLASS_PROPERTY}="native_input"]'
+        self.assertEqual(sheet.count(help_rule), 1)
+        self.assertEqual(sheet.count(input_rule), 1)
+        self.assertLess(sheet.index(help_rule), sheet.index(input_rule))
+
+    def test_declarations_unchanged(self):
+        """Test that only selectors change, not declarations"""
+        for style_name, style in NATIVE_STYLES.items():
+            sheet = scoped_stylesheet((style_name,))
+            self.assertEqual(sheet.replace(f'[{STYLE_CLASS_PROPERTY}="{style_name}"]', ""), style)
+
+    def test_unknown_style_is_empty(self):
+        """Test that an unknown style name contributes nothing"""
+        self.assertEqual(scoped_stylesheet(("no_such_style",)), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
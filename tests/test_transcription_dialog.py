@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for chunked transcript loading in the transcription dialog
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Test imports
+try:
+    from app.views.transcription_dialog import _split_into_chunks
+    IMPORTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Import error: {e}")
+    IMPORTS_AVAILABLE = False
+
+
+@unittest.skipUnless(IMPORTS_AVAILABLE, "Required modules not available")
+class TestSplitIntoChunks(unittest.TestCase):
+    """Test that transcript chunks rebuild the original text"""
+
+    def assert_reassembles(self, text, chunk_size):
+        """Check that joining the chunks as paragraphs gives back text"""
+        chunks = _split_into_chunks(text, chunk_size)
+        self.assertEqual("\n".join(chunks), text)
+        return chunks
+
+    def test_short_text_is_one_chunk(self):
+        """Test that text within the chunk size is not split"""
+        self.assertEqual(self.assert_reassembles("one line\ntwo lines", 100),
+                         ["one line\ntwo lines"])
+
+    def test_splits_at_line_breaks(self):
+        """Test that long text is split at line breaks within the chunk size"""
+        text = "\n".join(f"Line {i} of the transcript." for i in range(1000))
+        chunks = self.assert_reassembles(text, 500)
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) <= 500 for chunk in chunks))
+
+    def test_line_longer_than_chunk(self):
+        """Test that a line longer than a chunk is kept whole"""
+        text = "short\n" + "x" * 300 + "\nafter\n" + "y" * 50
+        chunks = self.assert_reassembles(text, 100)
+        self.assertIn("x" * 300, chunks)
+
+    def test_text_without_line_breaks(self):
+        """Test that text without line breaks stays in one chunk"""
+        self.assertEqual(self.assert_reassembles("z" * 1000, 100), ["z" * 1000])
+
+    def test_blank_lines_and_trailing_newline(self):
+        """Test that empty paragraphs and a trailing line break survive"""
+        text = ("para\n\n" * 200) + "\n"
+        self.assert_reassembles(text, 64)
+
+    def test_empty_text(self):
+        """Test that empty text gives a single empty chunk"""
+        self.assertEqual(self.assert_reassembles("", 100), [""])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Tests for sorting and searching in the Voice Memo table model
+"""
+
+import unittest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Test imports
+try:
+    from PySide6.QtCore import Qt, QPersistentModelIndex
+    from app.services.voice_memo_parser import VoiceMemoModel
+    from app.services.voice_memo_model import VoiceMemoTableModel, VoiceMemoStateManager
+    IMPORTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Import error: {e}")
+    IMPORTS_AVAILABLE = False
+
+
+@unittest.skipUnless(IMPORTS_AVAILABLE, "Required modules not available")
+class TestVoiceMemoTableModel(unittest.TestCase):
+    """Test VoiceMemoTableModel.sort and find_rows_containing"""
+
+    def setUp(self):
+        """Load a few memos with distinct titles, dates, durations and sizes"""
+        base = datetime(2025, 3, 1, 9, 30)
+        self.memos = [
+            VoiceMemoModel(uuid="a", title="Grocery list", creation_date=base,
+                           duration=120.0, file_size=3000),
+            VoiceMemoModel(uuid="b", title="meeting notes", creation_date=base + timedelta(days=2),
+                           duration=None, file_size=1000),
+            VoiceMemoModel(uuid="c", title="Band practice", creation_date=base + timedelta(days=1),
+                           duration=45.0, file_size=None),
+        ]
+        self.model = VoiceMemoTableModel(VoiceMemoStateManager())
+        self.model.set_memos(self.memos)
+
+    def uuids(self):
+        """Get the memo uuids in row order"""
+        return [self.model.get_memo_at_row(row).uuid for row in range(self.model.rowCount())]
+
+    def test_set_memos_newest_first(self):
+        """Test that loading orders memos by date, newest first"""
+        self.assertEqual(self.uuids(), ["b", "c", "a"])
+
+    def test_sort_by_each_column(self):
+        """Test sorting by title, date, duration and size"""
+        model = self.model
+        model.sort(model.COL_TITLE, Qt.SortOrder.AscendingOrder)
+        self.assertEqual(self.uuids(), ["c", "a", "b"])  # case-insensitive
+        model.sort(model.COL_DATE, Qt.SortOrder.AscendingOrder)
+        self.assertEqual(self.uuids(), ["a", "c", "b"])
+        model.sort(model.COL_DURATION, Qt.SortOrder.DescendingOrder)
+        self.assertEqual(self.uuids(), ["a", "c", "b"])  # missing duration sorts as 0
+        model.sort(model.COL_SIZE, Qt.SortOrder.AscendingOrder)
+        self.assertEqual(self.uuids(), ["c", "b", "a"])  # missing size sorts as 0
+
+    def test_reload_preserves_sort(self):
+        """Test that reloading memos keeps the current sort column and order"""
+        model = self.model
+        model.sort(model.COL_TITLE, Qt.SortOrder.AscendingOrder)
+        self.assertEqual(self.uuids(), ["c", "a", "b"])
+
+        model.set_memos(list(reversed(self.memos)))
+        self.assertEqual(self.uuids(), ["c", "a", "b"])
+
+        model.sort(model.COL_SIZE, Qt.SortOrder.DescendingOrder)
+        model.set_memos(self.memos)
+        self.assertEqual(self.uuids(), ["a", "b", "c"])
+
+    def test_sort_keeps_row_data_together(self):
+        """Test that cached per-row text moves with its memo"""
+        model = self.model
+        model.sort(model.COL_TITLE, Qt.SortOrder.AscendingOrder)
+        for row in range(model.rowCount()):
+            memo = model.get_memo_at_row(row)
+            self.assertIn(memo.title.lower(), model.get_search_text_at_row(row))
+            self.assertEqual(
+                model.data(model.index(row, model.COL_DATE), Qt.ItemDataRole.DisplayRole),
+                model._get_display_data(memo, model.COL_DATE)
+            )
+            self.assertEqual(model.get_sort_key(row, model.COL_DATE), memo.creation_date)
+
+    def test_sort_remaps_persistent_indexes(self):
+        """Test that persistent indexes stay on the same memo"""
+        model = self.model
+        persistent = QPersistentModelIndex(model.index(0, model.COL_TITLE))
+        self.assertEqual(model.get_memo_at_row(persistent.row()).uuid, "b")
+
+        model.sort(model.COL_TITLE, Qt.SortOrder.AscendingOrder)
+        self.assertEqual(persistent.row(), 2)
+        self.assertEqual(model.get_memo_at_row(persistent.row()).uuid, "b")
+
+    def test_resort_after_status_change(self):
+        """Test that a change in the sort column re-applies the sort"""
+        model = self.model
+        model.sort(model.COL_STATUS, Qt.SortOrder.DescendingOrder)
+        self.memos[2].transcription_status = "transcribed"
+        model.refresh_memo_statuses()
+
+        self.assertTrue(model._resort_pending)
+        model._resort()
+        self.assertEqual(self.uuids()[0], "c")
+
+    def test_no_resort_when_sort_key_unchanged(self):
+        """Test that row updates only re-sort when the sort key changed"""
+        model = self.model
+        last_column = model.columnCount() - 1
+
+        # Precomputed keys (here the date) never change between reloads
+        model.sort(model.COL_DATE, Qt.SortOrder.DescendingOrder)
+        self.memos[2].transcription_status = "transcribed"
+        model.dataChanged.emit(model.index(0, 0), model.index(2, last_column))
+        self.assertFalse(model._resort_pending)
+
+        # Sorted by status, an update that leaves the status text alone
+        model.sort(model.COL_STATUS, Qt.SortOrder.DescendingOrder)
+        model.dataChanged.emit(model.index(0, 0), model.index(2, last_column))
+        self.assertFalse(model._resort_pending)
+
+    def test_find_rows_containing(self):
+        """Test searching titles, file paths and dates"""
+        model = self.model
+        self.memos[0].file_path = Path("/tmp/Recordings/20250301 093000.m4a")
+        model.set_memos(self.memos)
+
+        self.assertEqual(self.uuids(), ["b", "c", "a"])
+        self.assertEqual(model.find_rows_containing("notes"), {0})
+        self.assertEqual(model.find_rows_containing("recordings"), {2})
+        self.assertEqual(model.find_rows_containing("2025-03-02"), {1})
+        self.assertEqual(model.find_rows_containing("01-mar-25"), {2})
+        self.assertEqual(model.find_rows_containing(""), {0, 1, 2})
+        self.assertEqual(model.find_rows_containing("nothing here"), set())
+
+    def test_find_rows_after_sort(self):
+        """Test that search results use the rows after sorting"""
+        model = self.model
+        model.sort(model.COL_TITLE, Qt.SortOrder.AscendingOrder)
+        self.assertEqual(model.find_rows_containing("grocery"), {1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for reading Voice Memo records from the database
+"""
+
+import asyncio
+import sqlite3
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Test imports
+try:
+    from app.services.voice_memo_parser import (
+        VoiceMemoDatabase, VoiceMemoParser, _RECORD_FIELDS, _DATE_FIELD_INDEX
+    )
+    IMPORTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Import error: {e}")
+    IMPORTS_AVAILABLE = False
+
+
+@unittest.skipUnless(IMPORTS_AVAILABLE, "Required modules not available")
+class TestRecordProjection(unittest.TestCase):
+    """Test the column projection behind raw record tuples"""
+
+    def test_match_columns_with_missing_columns(self):
+        """Test that missing fields map to None and the rest keep table spelling"""
+        columns = ["Z_PK", "ZDATE", "ZDURATION", "ZCUSTOMLABEL", "ZPATH"]
+        matched = VoiceMemoDatabase._match_columns(columns)
+
+        self.assertEqual(len(matched), len(_RECORD_FIELDS))
+        self.assertEqual(dict(zip(_RECORD_FIELDS, matched)), {
+            'path': "ZPATH",
+            'custom_label': "ZCUSTOMLABEL",
+            'encrypted_title': None,
+            'date': "ZDATE",
+            'duration': "ZDURATION",
+            'uuid': None,
+        })
+
+    def test_match_columns_is_case_insensitive(self):
+        """Test that columns are matched whatever their case"""
+        matched = VoiceMemoDatabase._match_columns(["path", "Uuid", "CreationDate"])
+        fields = dict(zip(_RECORD_FIELDS, matched))
+        self.assertEqual(fields['path'], "path")
+        self.assertEqual(fields['uuid'], "Uuid")
+        self.assertEqual(fields['date'], "CreationDate")
+
+    def test_date_field_index(self):
+        """Test that the date position follows _RECORD_FIELDS"""
+        self.assertEqual(list(_RECORD_FIELDS)[_DATE_FIELD_INDEX], 'date')
+
+
+@unittest.skipUnless(IMPORTS_AVAILABLE, "Required modules not available")
+class TestParseRecords(unittest.TestCase):
+    """Test parsing a database whose table lacks some columns"""
+
+    def setUp(self):
+        """Create a recordings table without ZUUID or ZENCRYPTEDTITLE"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.temp_dir.name)
+        db_path = self.folder / "CloudRecordings.db"
+
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE ZCLOUDRECORDING "
+            "(Z_PK INTEGER, ZDATE REAL, ZDURATION REAL, ZCUSTOMLABEL TEXT, ZPATH TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO ZCLOUDRECORDING VALUES (1, 736000000, 45.5, 'Meeting', 'Recording1.m4a')"
+        )
+        conn.commit()
+        conn.close()
+
+        (self.folder / "Recording1.m4a").write_bytes(b"dummy audio data")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_db_data_uses_column_names(self):
+        """Test that db_data is keyed by the table's own column names"""
+        parser = VoiceMemoParser(self.folder)
+        memos = asyncio.run(parser.load_voice_memos())
+
+        self.assertEqual(len(memos), 1)
+        memo = memos[0]
+        self.assertEqual(memo.title, "Meeting")
+        self.assertEqual(memo.duration, 45.5)
+        self.assertEqual(memo.creation_date.year, 2024)
+        self.assertEqual(memo.db_data['ZPATH'], "Recording1.m4a")
+        self.assertEqual(memo.db_data['ZCUSTOMLABEL'], "Meeting")
+        self.assertNotIn('ZUUID', memo.db_data)
+        self.assertTrue(memo.file_exists)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Tests for model file hashing and integrity verification
+"""
+
+import hashlib
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Test imports
+try:
+    from app.services import whisper_model_manager
+    from app.services.whisper_model_manager import (
+        WhisperModelManager, sha256_file, sha256_shards, VERIFIED_MARKER_SUFFIX
+    )
+    IMPORTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Import error: {e}")
+    IMPORTS_AVAILABLE = False
+
+
+@unittest.skipUnless(IMPORTS_AVAILABLE, "Required modules not available")
+class TestModelHashing(unittest.TestCase):
+    """Test the SHA256 helpers against hashlib"""
+
+    def setUp(self):
+        """Write a file spanning several shards"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data = os.urandom(3 * 1024 * 1024 + 123)
+        self.file_path = Path(self.temp_dir.name) / "model.bin"
+        self.file_path.write_bytes(self.data)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_sha256_file_matches_hashlib(self):
+        """Test that sha256_file matches hashlib on the same bytes"""
+        self.assertEqual(sha256_file(self.file_path).hexdigest(),
+                         hashlib.sha256(self.data).hexdigest())
+
+    def test_sha256_file_without_mmap(self):
+        """Test the read fallback used when the file cannot be mapped"""
+        with mock.patch("mmap.mmap", side_effect=OSError("no mmap")):
+            digest = sha256_file(self.file_path).hexdigest()
+        self.assertEqual(digest, hashlib.sha256(self.data).hexdigest())
+
+    def test_sha256_file_empty(self):
+        """Test that an empty file hashes like empty bytes"""
+        empty = Path(self.temp_dir.name) / "empty.bin"
+        empty.write_bytes(b"")
+        self.assertEqual(sha256_file(empty).hexdigest(), hashlib.sha256(b"").hexdigest())
+
+    def test_sha256_shards_match_hashlib(self):
+        """Test that each shard digest matches hashlib on that slice"""
+        shard_size = 1024 * 1024
+        expected = [
+            hashlib.sha256(self.data[offset:offset + shard_size]).hexdigest()
+            for offset in range(0, len(self.data), shard_size)
+        ]
+        self.assertEqual(sha256_shards(self.file_path, shard_size), expected)
+        self.assertEqual(len(expected), 4)
+
+    def test_sha256_shards_empty(self):
+        """Test that an empty file has no shards"""
+        empty = Path(self.temp_dir.name) / "empty.bin"
+        empty.write_bytes(b"")
+        self.assertEqual(sha256_shards(empty), [])
+
+
+@unittest.skipUnless(IMPORTS_AVAILABLE, "Required modules not available")
+class TestVerifiedMarker(unittest.TestCase):
+    """Test the .verified sidecar that lets verification skip re-hashing"""
+
+    def setUp(self):
+        """Point a model manager at a temporary model file"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data = os.urandom(2 * 1024 * 1024)
+        self.model_file = str(Path(self.temp_dir.name) / "model.bin")
+        Path(self.model_file).write_bytes(self.data)
+        self.marker_file = self.model_file + VERIFIED_MARKER_SUFFIX
+
+        self.download_info = {
+            "destination_path": self.model_file,
+            "sha256": hashlib.sha256(self.data).hexdigest(),
+            "blake3": None,
+            "sha256_tree": None,
+        }
+        self.manager = WhisperModelManager()
+        self.manager.get_model_download_info = lambda model_id: dict(self.download_info)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_marker_round_trip(self):
+        """Test that a verified file is not hashed again"""
+        self.assertTrue(self.manager.verify_model_integrity("test"))
+        self.assertTrue(os.path.exists(self.marker_file))
+
+        with mock.patch.object(whisper_model_manager, "sha256_file",
+                               side_effect=AssertionError("re-hashed")):
+            self.assertTrue(self.manager.verify_model_integrity("test"))
+
+    def test_marker_records_algorithm(self):
+        """Test that the marker names the checksum that verified the file"""
+        shard_digests = sha256_shards(self.model_file)
+        self.download_info["sha256_tree"] = shard_digests
+        self.assertTrue(self.manager.verify_model_integrity("test"))
+
+        size, mtime_ns, algorithm, digest = self.manager._read_verified_marker(self.marker_file)
+        self.assertEqual(size, len(self.data))
+        self.assertEqual(algorithm, "sha256_tree")
+        self.assertEqual(digest, ",".join(shard_digests))
+
+    def test_marker_invalidated_by_file_change(self):
+        """Test that modifying the file forces a new verification"""
+        self.assertTrue(self.manager.verify_model_integrity("test"))
+
+        with open(self.model_file, "r+b") as f:
+            f.write(b"corrupt")
+        st = os.stat(self.model_file)
+        os.utime(self.model_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        self.assertFalse(self.manager.verify_model_integrity("test"))
+
+    def test_marker_invalidated_by_checksum_change(self):
+        """Test that changing the checksum that verified the file is noticed"""
+        self.download_info["sha256_tree"] = sha256_shards(self.model_file)
+        self.assertTrue(self.manager.verify_model_integrity("test"))
+
+        # sha256 is unchanged, but the tree that verified the file is not
+        self.download_info["sha256_tree"] = ["00" * 32]
+        self.assertFalse(self.manager.verify_model_integrity("test"))
+
+    def test_old_marker_format_ignored(self):
+        """Test that a marker without an algorithm triggers re-verification"""
+        st = os.stat(self.model_file)
+        with open(self.marker_file, "w", encoding="ascii") as f:
+            f.write(f"{st.st_size} {st.st_mtime_ns} {'00' * 32}")
+
+        self.assertIsNone(self.manager._read_verified_marker(self.marker_file))
+        self.assertTrue(self.manager.verify_model_integrity("test"))
+
+
+
+@unittest.skipUnless(IMPORTS_AVAILABLE, "Required modules not available")
+class TestModelStatuses(unittest.TestCase):
+    """Test batch model status lookups"""
+
+    def setUp(self):
+        """Point a model manager at an empty temporary models directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = WhisperModelManager()
+        self.manager._models_dir_str = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get_all_statuses_matches_per_model_status(self):
+        """Test that one directory scan gives the same text as per-model lookups"""
+        model_ids = list(self.manager._model_by_id)
+        downloaded = self.manager.get_model_info(model_ids[0])
+        partial = self.manager.get_model_info(model_ids[1])
+        Path(self.temp_dir.name, downloaded.filename).write_bytes(b"\0" * (2 * 1024 * 1024))
+        Path(self.temp_dir.name, partial.filename).write_bytes(b"\0" * 1024)
+
+        statuses = self.manager.get_all_statuses()
+        self.assertEqual([model_id for model_id, _, _ in statuses], model_ids)
+        for model_id, display_name, status_text in statuses:
+            self.assertEqual(status_text, self.manager.get_model_status_text(model_id))
+        status_by_id = {model_id: status_text for model_id, _, status_text in statuses}
+        self.assertEqual(status_by_id[model_ids[0]], "Downloaded")
+        self.assertTrue(status_by_id[model_ids[1]].startswith("Not downloaded"))
+
+    def test_get_all_statuses_missing_directory(self):
+        """Test that a missing models directory reports nothing downloaded"""
+        self.manager._models_dir_str = str(Path(self.temp_dir.name) / "missing")
+        statuses = self.manager.get_all_statuses()
+        self.assertTrue(all(text.startswith("Not downloaded") for _, _, text in statuses))
+
+
+if __name__ == '__main__':
+    unittest.main()